@@ -19,16 +19,32 @@ Log files detected:
 """
 
 import argparse
+import errno
+import fnmatch
+import gzip
+import os
 import shutil
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    # ISA-L deflate is a drop-in, 2-4x faster gzip implementation
+    from isal import igzip as fast_gzip
+except ImportError:
+    fast_gzip = None
+
 # Configuration
 PROJECT_ROOT = Path(__file__).parent.parent
 ARCHIVE_DIR = PROJECT_ROOT / "archives" / "logs"
 DEFAULT_AGE_DAYS = 14
 DEFAULT_SIZE_MB = 1024  # 1GB
+COMPRESS_THRESHOLD = 10 * 1024 * 1024  # Compress files larger than 10MB
+GZIP_LEVEL = 6  # zlib default; level 9 is much slower for little gain on logs
+COPY_BUFFER_SIZE = 1024 * 1024  # 1MB chunks keep deflate calls few and large
 
 # Log file patterns to check
 LOG_PATTERNS = [
@@ -40,65 +56,112 @@ LOG_PATTERNS = [
 ]
 
 
-def get_log_files() -> list[Path]:
-    """Find all log files in the project."""
+@dataclass
+class LogInfo:
+    """A log file with its metadata captured from a single stat() call."""
+    path: Path
+    size: int
+    mtime: float
+
+
+def get_log_files() -> list[LogInfo]:
+    """Find all log files in the project.
+
+    Each directory is scanned once with os.scandir() so that file metadata
+    comes from the directory entry instead of repeated stat() calls.
+    """
+    # Group patterns by directory so each directory is only read once
+    patterns_by_dir: dict[Path, list[str]] = {}
+    for pattern, directory in LOG_PATTERNS:
+        patterns_by_dir.setdefault(directory, []).append(pattern)
+
     log_files = []
     seen = set()
 
-    for pattern, directory in LOG_PATTERNS:
-        if directory.exists():
-            for f in directory.glob(pattern):
-                if f.is_file() and f not in seen:
-                    log_files.append(f)
-                    seen.add(f)
+    for directory, patterns in patterns_by_dir.items():
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            continue
+
+        for pattern in patterns:
+            for entry in entries:
+                if entry.path in seen or not fnmatch.fnmatch(entry.name, pattern):
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                st = entry.stat()
+                log_files.append(LogInfo(Path(entry.path), st.st_size, st.st_mtime))
+                seen.add(entry.path)
 
     return log_files
 
 
-def get_total_size(files: list[Path]) -> int:
+def get_total_size(files: list[LogInfo]) -> int:
     """Get total size of files in bytes."""
-    return sum(f.stat().st_size for f in files if f.exists())
+    return sum(f.size for f in files)
+
+
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 
 def format_size(size_bytes: int) -> str:
     """Format bytes as human-readable string."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} TB"
+    # Each unit is 2**10 larger, so the bit length picks the unit directly
+    idx = min((size_bytes.bit_length() - 1) // 10, len(SIZE_UNITS) - 1) if size_bytes > 0 else 0
+    return f"{size_bytes / (1 << (10 * idx)):.1f} {SIZE_UNITS[idx]}"
 
 
-def get_file_age(file: Path) -> timedelta:
+def get_file_age(file: LogInfo) -> timedelta:
     """Get age of file based on modification time."""
-    mtime = datetime.fromtimestamp(file.stat().st_mtime)
+    mtime = datetime.fromtimestamp(file.mtime)
     return datetime.now() - mtime
 
 
-def archive_file(file: Path, archive_dir: Path) -> Path:
-    """Archive a file with timestamp in filename."""
+def open_gzip_writer(path: Path):
+    """Open a gzip file for writing, preferring ISA-L when installed."""
+    if fast_gzip is not None:
+        return fast_gzip.open(path, 'wb')
+    return gzip.open(path, 'wb', compresslevel=GZIP_LEVEL)
+
+
+def archive_file(log: LogInfo, archive_dir: Path, timestamp: str | None = None,
+                 index: int | None = None) -> Path:
+    """Archive a file with timestamp in filename.
+
+    run_archive passes one timestamp for the whole run, plus an index for
+    files whose names would otherwise collide in the archive directory.
+    """
     archive_dir.mkdir(parents=True, exist_ok=True)
+    file = log.path
 
     # Create archive filename with date
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    archive_name = f"{file.stem}_{timestamp}{file.suffix}"
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    unique = f"_{index}" if index is not None else ""
+    archive_name = f"{file.stem}_{timestamp}{unique}{file.suffix}"
     archive_path = archive_dir / archive_name
 
     # Compress if large, otherwise just move
-    if file.stat().st_size > 10 * 1024 * 1024:  # >10MB
-        import gzip
+    if log.size > COMPRESS_THRESHOLD:
         archive_path = archive_path.with_suffix(archive_path.suffix + '.gz')
         with open(file, 'rb') as f_in:
-            with gzip.open(archive_path, 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
+            with open_gzip_writer(archive_path) as f_out:
+                shutil.copyfileobj(f_in, f_out, length=COPY_BUFFER_SIZE)
         file.unlink()
     else:
-        shutil.move(str(file), str(archive_path))
+        try:
+            # Same filesystem: a single atomic rename, no data copied
+            os.replace(file, archive_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(file, archive_path)
 
     return archive_path
 
 
-def check_status(log_files: list[Path], age_days: int):
+def check_status(log_files: list[LogInfo], age_days: int):
     """Display current log status."""
     total_size = get_total_size(log_files)
 
@@ -113,12 +176,12 @@ def check_status(log_files: list[Path], age_days: int):
 
     if log_files:
         print("FILES:")
-        for f in sorted(log_files, key=lambda x: x.stat().st_size, reverse=True):
+        for f in sorted(log_files, key=lambda x: x.size, reverse=True):
             age = get_file_age(f)
-            size = format_size(f.stat().st_size)
+            size = format_size(f.size)
             age_str = f"{age.days}d" if age.days > 0 else f"{age.seconds//3600}h"
             old_marker = " [OLD]" if age.days >= age_days else ""
-            print(f"  {f.name:<30} {size:>10}  ({age_str}){old_marker}")
+            print(f"  {f.path.name:<30} {size:>10}  ({age_str}){old_marker}")
     else:
         print("No log files found.")
 
@@ -145,23 +208,55 @@ def run_archive(age_days: int, size_threshold_mb: int, force: bool = False) -> d
         return results
 
     # Find old files to archive
-    cutoff = datetime.now() - timedelta(days=age_days)
-
-    for f in log_files:
-        mtime = datetime.fromtimestamp(f.stat().st_mtime)
-        if mtime < cutoff:
-            file_size = f.stat().st_size
+    cutoff = (datetime.now() - timedelta(days=age_days)).timestamp()
+    files_to_archive = [f for f in log_files if f.mtime < cutoff]
+
+    # One timestamp per run; number files that share a name (e.g. the same
+    # log name in two directories) so they don't overwrite each other
+    run_ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+    name_counts = Counter(f.path.name for f in files_to_archive)
+    seen_names = Counter()
+    jobs = []
+    for f in files_to_archive:
+        index = None
+        if name_counts[f.path.name] > 1:
+            index = seen_names[f.path.name]
+            seen_names[f.path.name] += 1
+        jobs.append((f, index))
+
+    if len(files_to_archive) > 1:
+        # Compression is CPU-bound, so spread independent files across processes
+        workers = min(len(files_to_archive), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                (f, pool.submit(archive_file, f, ARCHIVE_DIR, run_ts, index))
+                for f, index in jobs
+            ]
+            outcomes = []
+            for f, future in futures:
+                try:
+                    outcomes.append((f, future.result(), None))
+                except Exception as e:
+                    outcomes.append((f, None, e))
+    else:
+        outcomes = []
+        for f, index in jobs:
             try:
-                archive_path = archive_file(f, ARCHIVE_DIR)
-                results["files_archived"].append({
-                    "original": str(f),
-                    "archived": str(archive_path),
-                    "size": file_size
-                })
-                results["space_freed"] += file_size
-                print(f"[ARCHIVED] {f.name} -> {archive_path.name}")
+                outcomes.append((f, archive_file(f, ARCHIVE_DIR, run_ts, index), None))
             except Exception as e:
-                print(f"[ERROR] Failed to archive {f.name}: {e}")
+                outcomes.append((f, None, e))
+
+    for f, archive_path, error in outcomes:
+        if error is not None:
+            print(f"[ERROR] Failed to archive {f.path.name}: {error}")
+            continue
+        results["files_archived"].append({
+            "original": str(f.path),
+            "archived": str(archive_path),
+            "size": f.size
+        })
+        results["space_freed"] += f.size
+        print(f"[ARCHIVED] {f.path.name} -> {archive_path.name}")
 
     return results
 
@@ -12,27 +12,38 @@ Usage:
 """
 
 import argparse
+import functools
+import os
 import re
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def find_markdown_links(content: str) -> list[tuple[str, str]]:
+# Match [text](url) pattern; compiled once and reused for every file
+LINK_PATTERN = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+# Link prefixes that are not relative file references
+EXTERNAL_PREFIXES = ('http://', 'https://', 'mailto:', '#')
+
+
+def find_markdown_links(content: str) -> Iterator[tuple[str, str]]:
     """
     Extract markdown links from content.
-    Returns list of (link_text, link_target) tuples.
+    Yields (link_text, link_target) tuples lazily as they are matched.
     """
-    # Match [text](url) pattern, excluding external URLs
-    pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-    matches = re.findall(pattern, content)
+    for match in LINK_PATTERN.finditer(content):
+        target = match.group(2)
+        # Filter to relative links only (not http/https/mailto)
+        if not target.startswith(EXTERNAL_PREFIXES):
+            yield match.group(1), target
 
-    # Filter to relative links only (not http/https/mailto)
-    relative_links = [
-        (text, target)
-        for text, target in matches
-        if not target.startswith(('http://', 'https://', 'mailto:', '#'))
-    ]
-    return relative_links
+
+@functools.lru_cache(maxsize=None)
+def path_exists(path: str) -> bool:
+    """Check whether a path exists, caching results across all checked files."""
+    return os.path.exists(path)
 
 
 def check_file_links(filepath: Path, repo_root: Path) -> list[dict]:
@@ -47,22 +58,23 @@ def check_file_links(filepath: Path, repo_root: Path) -> list[dict]:
     except Exception as e:
         return [{'file': str(filepath), 'error': f'Could not read file: {e}'}]
 
-    links = find_markdown_links(content)
     file_dir = filepath.parent
 
-    for link_text, link_target in links:
+    for link_text, link_target in find_markdown_links(content):
         # Remove any anchor from the link
         target_path = link_target.split('#')[0]
         if not target_path:
             continue  # Pure anchor link like (#section)
 
-        # Resolve relative to the markdown file's directory
-        full_path = (file_dir / target_path).resolve()
+        # Resolve relative to the markdown file's directory. normpath collapses
+        # ".." lexically; unlike resolve() it does not stat each component to
+        # follow symlinks, which link validation does not need.
+        full_path = Path(os.path.normpath(file_dir / target_path))
 
         # Also try relative to repo root (common for README links)
-        repo_path = (repo_root / target_path).resolve()
+        repo_path = Path(os.path.normpath(repo_root / target_path))
 
-        if not full_path.exists() and not repo_path.exists():
+        if not path_exists(str(full_path)) and not path_exists(str(repo_path)):
             broken.append({
                 'file': str(filepath.relative_to(repo_root)),
                 'link_text': link_text,
@@ -76,17 +88,38 @@ def check_file_links(filepath: Path, repo_root: Path) -> list[dict]:
     return broken
 
 
-def find_all_markdown_files(repo_root: Path) -> list[Path]:
-    """Find all markdown files in the repository."""
-    return list(repo_root.rglob('*.md'))
+MARKDOWN_SUFFIX = '.md'
+
+# Directories never descended into when scanning the whole repository
+EXCLUDED_DIRS = frozenset({
+    '.git', 'node_modules', 'archive', 'archives', '__pycache__',
+    '.venv', 'venv', 'bin', 'obj',
+})
 
 
-def main():
+def find_all_markdown_files(repo_root: Path) -> list[Path]:
+    """
+    Find all markdown files in the repository.
+    Excluded directories are pruned before descent rather than filtered afterwards.
+    """
+    files = []
+    for dirpath, dirnames, filenames in os.walk(repo_root):
+        dirnames[:] = [d for d in dirnames if d not in EXCLUDED_DIRS]
+        # Plain string suffix test; Path objects are only built for matches
+        matches = [f for f in filenames if f.endswith(MARKDOWN_SUFFIX)]
+        if matches:
+            root = Path(dirpath)
+            files.extend(root / f for f in matches)
+    return files
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the link checker. argv defaults to sys.argv[1:]; returns the exit code."""
     parser = argparse.ArgumentParser(description='Check markdown links for broken references')
     parser.add_argument('files', nargs='*', help='Markdown files to check')
     parser.add_argument('--all', action='store_true', help='Check all .md files in repository')
     parser.add_argument('--repo-root', type=Path, default=None, help='Repository root directory')
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Determine repo root
     if args.repo_root:
@@ -105,22 +138,26 @@ def main():
     # Gather files to check
     if args.all:
         files = find_all_markdown_files(repo_root)
-        # Exclude archive and node_modules
-        files = [f for f in files if 'archive' not in f.parts and 'node_modules' not in f.parts]
     elif args.files:
         files = [Path(f).resolve() for f in args.files]
     else:
         parser.print_help()
-        sys.exit(1)
+        return 1
 
-    # Check each file
-    all_broken = []
+    # Check each file; reads and stats are I/O-bound, so overlap them in
+    # threads (map() keeps results in input order)
+    existing = []
     for filepath in files:
         if not filepath.exists():
             print(f"Warning: File not found: {filepath}")
             continue
-        broken = check_file_links(filepath, repo_root)
-        all_broken.extend(broken)
+        existing.append(filepath)
+
+    all_broken = []
+    if existing:
+        with ThreadPoolExecutor(max_workers=min(8, len(existing))) as pool:
+            for broken in pool.map(lambda f: check_file_links(f, repo_root), existing):
+                all_broken.extend(broken)
 
     # Report results
     if all_broken:
@@ -133,11 +170,11 @@ def main():
                 print(f"    [{item['link_text']}]({item['link_target']})")
                 print(f"    Checked: {item['checked_paths'][0]}")
         print()
-        sys.exit(1)
+        return 1
     else:
         print(f"OK: All links valid in {len(files)} file(s)")
-        sys.exit(0)
+        return 0
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -21,17 +21,24 @@ Environment variables (optional, for --check-rules):
 
 import argparse
 import ipaddress
-import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Error: requests library required. Install with: pip install requests")
     sys.exit(1)
 
+try:
+    from orjson import loads as json_loads  # Faster parsing for large API payloads
+except ImportError:
+    from json import loads as json_loads
+
 # GitHub Actions IP ranges (from https://api.github.com/meta)
 # These are the ranges we've configured in Cloudflare
 GITHUB_ACTIONS_CIDRS = [
@@ -49,9 +56,32 @@ GITHUB_ACTIONS_EXTENDED_CIDRS = [
     "20.0.0.0/8",        # Azure general (very broad)
 ]
 
+# Exact-match lookup for ranges reported by the GitHub meta API
+GITHUB_ACTIONS_CIDR_SET = frozenset(GITHUB_ACTIONS_CIDRS)
+
+# Parsed once at import so membership checks don't re-parse CIDR strings
+GITHUB_ACTIONS_NETWORKS = [
+    (cidr, ipaddress.ip_network(cidr, strict=False)) for cidr in GITHUB_ACTIONS_CIDRS
+]
+GITHUB_ACTIONS_EXTENDED_NETWORKS = [
+    (cidr, ipaddress.ip_network(cidr, strict=False)) for cidr in GITHUB_ACTIONS_EXTENDED_CIDRS
+]
+
 DEFAULT_URL = "https://psfordtaurus.com/health/live"
 AZURE_DIRECT_URL = "https://app-stockanalyzer-prod.azurewebsites.net/health/live"
 
+# Shared session so repeated requests reuse pooled TCP/TLS connections.
+# Only connection failures are retried: read=False re-raises read timeouts
+# straight away, so a hung endpoint is still reported as a timeout.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, read=False, backoff_factor=0.3),
+))
+# Keep the python-requests token so Bot Fight Mode sees the same client type as before
+SESSION.headers["User-Agent"] = f"cloudflare_test/1.0 {requests.utils.default_user_agent()}"
+
 
 def get_public_ip():
     """Get the current machine's public IP address."""
@@ -60,22 +90,38 @@ def get_public_ip():
         "https://ifconfig.me/ip",
         "https://icanhazip.com",
     ]
-    for service in services:
+
+    def query(service: str) -> str | None:
         try:
-            response = requests.get(service, timeout=5)
+            response = SESSION.get(service, timeout=5)
             if response.status_code == 200:
                 return response.text.strip()
         except Exception:
-            continue
-    return None
+            pass
+        return None
+
+    # Race the services and take the first answer, so one slow or dead
+    # service doesn't add its full timeout to the run
+    pool = ThreadPoolExecutor(max_workers=len(services))
+    try:
+        futures = [pool.submit(query, service) for service in services]
+        for future in as_completed(futures):
+            ip = future.result()
+            if ip:
+                return ip
+        return None
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
 
-def ip_in_cidr(ip_str: str, cidr_list: list[str]) -> tuple[bool, str | None]:
-    """Check if an IP address is within any of the given CIDR ranges."""
+def ip_in_cidr(
+    ip_str: str,
+    networks: list[tuple[str, ipaddress.IPv4Network | ipaddress.IPv6Network]],
+) -> tuple[bool, str | None]:
+    """Check if an IP address is within any of the given pre-parsed CIDR ranges."""
     try:
         ip = ipaddress.ip_address(ip_str)
-        for cidr in cidr_list:
-            network = ipaddress.ip_network(cidr, strict=False)
+        for cidr, network in networks:
             if ip in network:
                 return True, cidr
         return False, None
@@ -96,7 +142,7 @@ def test_endpoint(url: str, verbose: bool = False) -> dict:
     }
 
     try:
-        response = requests.get(url, timeout=30, allow_redirects=True)
+        response = SESSION.get(url, timeout=30, allow_redirects=True)
         result["status_code"] = response.status_code
         result["response_time_ms"] = int(response.elapsed.total_seconds() * 1000)
         result["success"] = response.status_code == 200
@@ -133,18 +179,18 @@ def check_cloudflare_rules(zone_id: str, api_token: str, verbose: bool = False):
     url = f"https://api.cloudflare.com/client/v4/zones/{zone_id}/rulesets"
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = SESSION.get(url, headers=headers, timeout=10)
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             print("\n=== Cloudflare Rulesets ===")
             for ruleset in data.get("result", []):
                 print(f"  - {ruleset.get('name', 'unnamed')} (phase: {ruleset.get('phase')})")
                 if verbose and ruleset.get("id"):
                     # Get ruleset details
                     detail_url = f"https://api.cloudflare.com/client/v4/zones/{zone_id}/rulesets/{ruleset['id']}"
-                    detail_resp = requests.get(detail_url, headers=headers, timeout=10)
+                    detail_resp = SESSION.get(detail_url, headers=headers, timeout=10)
                     if detail_resp.status_code == 200:
-                        detail_data = detail_resp.json()
+                        detail_data = json_loads(detail_resp.content)
                         for rule in detail_data.get("result", {}).get("rules", []):
                             print(f"      Rule: {rule.get('description', 'no description')}")
                             print(f"        Expression: {rule.get('expression', 'N/A')}")
@@ -160,9 +206,9 @@ def check_cloudflare_rules(zone_id: str, api_token: str, verbose: bool = False):
 def fetch_github_actions_ips():
     """Fetch current GitHub Actions IP ranges from GitHub's meta API."""
     try:
-        response = requests.get("https://api.github.com/meta", timeout=10)
+        response = SESSION.get("https://api.github.com/meta", timeout=10)
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             return data.get("actions", [])
         return None
     except Exception:
@@ -215,16 +261,25 @@ def main():
     print("Cloudflare Connectivity Diagnostic Tool")
     print("=" * 60)
 
+    # The network probes are independent, so start them all now and collect
+    # each result where it is printed, keeping the output order fixed
+    pool = ThreadPoolExecutor(max_workers=4)
+    ip_future = pool.submit(get_public_ip)
+    endpoint_future = pool.submit(test_endpoint, args.url, args.verbose)
+    azure_future = pool.submit(test_endpoint, AZURE_DIRECT_URL, args.verbose)
+    gh_ips_future = pool.submit(fetch_github_actions_ips) if args.fetch_github_ips else None
+    pool.shutdown(wait=False)  # No more work; submitted probes keep running
+
     # Get and check current IP
     print("\n=== Your Public IP ===")
-    my_ip = get_public_ip()
+    my_ip = ip_future.result()
     if my_ip:
         print(f"  IP Address: {my_ip}")
-        in_gh_range, matched_cidr = ip_in_cidr(my_ip, GITHUB_ACTIONS_CIDRS)
+        in_gh_range, matched_cidr = ip_in_cidr(my_ip, GITHUB_ACTIONS_NETWORKS)
         if in_gh_range:
             print(f"  Status: IN configured GitHub Actions range ({matched_cidr})")
         else:
-            in_extended, ext_cidr = ip_in_cidr(my_ip, GITHUB_ACTIONS_EXTENDED_CIDRS)
+            in_extended, ext_cidr = ip_in_cidr(my_ip, GITHUB_ACTIONS_EXTENDED_NETWORKS)
             if in_extended:
                 print(f"  Status: IN extended GitHub/Azure range ({ext_cidr})")
                 print("  Note: This range may not be in your Cloudflare rule!")
@@ -236,11 +291,11 @@ def main():
     # Check specific IP if requested
     if args.ip_check:
         print(f"\n=== Checking IP: {args.ip_check} ===")
-        in_gh, cidr = ip_in_cidr(args.ip_check, GITHUB_ACTIONS_CIDRS)
+        in_gh, cidr = ip_in_cidr(args.ip_check, GITHUB_ACTIONS_NETWORKS)
         if in_gh:
             print(f"  IN configured range: {cidr}")
         else:
-            in_ext, ext_cidr = ip_in_cidr(args.ip_check, GITHUB_ACTIONS_EXTENDED_CIDRS)
+            in_ext, ext_cidr = ip_in_cidr(args.ip_check, GITHUB_ACTIONS_EXTENDED_NETWORKS)
             if in_ext:
                 print(f"  IN extended range: {ext_cidr} (may need to add to Cloudflare)")
             else:
@@ -249,10 +304,10 @@ def main():
     # Fetch GitHub IPs if requested
     if args.fetch_github_ips:
         print("\n=== GitHub Actions IP Ranges (from api.github.com/meta) ===")
-        gh_ips = fetch_github_actions_ips()
+        gh_ips = gh_ips_future.result()
         if gh_ips:
             for cidr in sorted(gh_ips):
-                in_our_list = cidr in GITHUB_ACTIONS_CIDRS
+                in_our_list = cidr in GITHUB_ACTIONS_CIDR_SET
                 marker = "[CONFIGURED]" if in_our_list else "[NOT CONFIGURED]"
                 print(f"  {cidr} {marker}")
         else:
@@ -260,7 +315,7 @@ def main():
 
     # Test endpoints
     print(f"\n=== Testing: {args.url} ===")
-    result = test_endpoint(args.url, args.verbose)
+    result = endpoint_future.result()
 
     if result["success"]:
         print(f"  Status: OK ({result['status_code']})")
@@ -282,7 +337,7 @@ def main():
     # Test direct Azure endpoint (bypasses Cloudflare)
     print(f"\n=== Testing Direct Azure URL (bypasses Cloudflare) ===")
     print(f"  URL: {AZURE_DIRECT_URL}")
-    azure_result = test_endpoint(AZURE_DIRECT_URL, args.verbose)
+    azure_result = azure_future.result()
 
     if azure_result["success"]:
         print(f"  Status: OK ({azure_result['status_code']})")
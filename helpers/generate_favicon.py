@@ -23,6 +23,7 @@ Output files (in wwwroot/):
     apple-touch-icon.png - PNG 180x180 (iOS)
 """
 
+import mmap
 import os
 import sys
 import argparse
@@ -42,6 +43,9 @@ WWWROOT = PROJECT_ROOT / "stock_analyzer_dotnet" / "src" / "StockAnalyzer.Api" /
 SIZES = [16, 32, 48, 64, 128, 180, 192, 512]
 ICO_SIZES = [(16, 16), (32, 32), (48, 48)]
 
+# Sources are reduced to at most this before conversion (2x the largest favicon)
+WORKING_SIZE = (1024, 1024)
+
 
 def log(message: str):
     """Print timestamped log message."""
@@ -60,32 +64,51 @@ def generate_favicons(source_path: str, output_dir: Path = WWWROOT):
 
     # Load and prepare image
     log(f"Loading source: {source}")
-    img = Image.open(source)
+    # Decode straight from a read-only memory map of the source (mmap is
+    # file-like) rather than through buffered file reads
+    with open(source, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        img = Image.open(mm)
+        log(f"Source size: {img.size[0]}x{img.size[1]}")
+
+        # Shrink to a working size before any full-image conversion. For JPEGs,
+        # draft() lets libjpeg decode at a reduced scale instead of full resolution.
+        img.draft('RGB', WORKING_SIZE)
+        img.thumbnail(WORKING_SIZE, Image.Resampling.LANCZOS)
+        img.load()  # Finish decoding before the mapping is closed
 
     # Convert to RGBA for transparency support
     if img.mode != 'RGBA':
         img = img.convert('RGBA')
 
-    log(f"Source size: {img.size[0]}x{img.size[1]}")
-
     # Ensure output directory exists
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    # Downscale progressively from the largest size to the smallest, so each
+    # step resamples the previous (already small) image instead of the full
+    # source. The first step uses a reducing_gap so Pillow does a cheap box
+    # reduction before the Lanczos pass on large sources.
+    resized = {}
+    current = img
+    for size in sorted(SIZES, reverse=True):
+        reducing_gap = 3.0 if current is img else None
+        current = current.resize((size, size), Image.Resampling.LANCZOS, reducing_gap=reducing_gap)
+        resized[size] = current
+
     # Generate PNG files at various sizes
     for size in SIZES:
-        resized = img.resize((size, size), Image.Resampling.LANCZOS)
         output_path = output_dir / f"favicon-{size}x{size}.png"
-        resized.save(output_path, 'PNG')
+        resized[size].save(output_path, 'PNG')
         log(f"Created: favicon-{size}x{size}.png")
 
-    # Generate ICO file with multiple sizes
-    ico_images = [img.resize(s, Image.Resampling.LANCZOS) for s in ICO_SIZES]
+    # Generate ICO file with multiple sizes (Pillow downsizes the largest
+    # image to each requested ICO size)
     ico_path = output_dir / "favicon.ico"
-    ico_images[0].save(ico_path, format='ICO', sizes=ICO_SIZES)
+    largest_ico = max(ICO_SIZES)[0]
+    resized[largest_ico].save(ico_path, format='ICO', sizes=ICO_SIZES)
     log(f"Created: favicon.ico (16, 32, 48px)")
 
     # Generate apple-touch-icon
-    apple_icon = img.resize((180, 180), Image.Resampling.LANCZOS)
+    apple_icon = resized[180]
     apple_path = output_dir / "apple-touch-icon.png"
     apple_icon.save(apple_path, 'PNG')
     log(f"Created: apple-touch-icon.png")
@@ -112,8 +135,12 @@ def generate_favicons(source_path: str, output_dir: Path = WWWROOT):
   "display": "standalone"
 }
 """
-    manifest_path.write_text(manifest_content)
-    log(f"Updated: site.webmanifest")
+    # Skip the write when unchanged so the file's mtime/ETag stays stable
+    if manifest_path.exists() and manifest_path.read_text() == manifest_content:
+        log(f"Unchanged: site.webmanifest")
+    else:
+        manifest_path.write_text(manifest_content)
+        log(f"Updated: site.webmanifest")
 
     # Archive original source
     archive_dir = PROJECT_ROOT / "archive" / "favicons"
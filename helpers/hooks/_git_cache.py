@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Shared staged-file lookup for the git hooks.
+
+Each pre-commit hook needs the list of staged files. Rather than every hook
+forking `git diff --cached`, the first hook to run stores the result in a temp
+file keyed by the state of the git index; the other hooks read it back.
+The cache is invalidated automatically whenever the index changes.
+
+All hooks share the one unfiltered list; hooks only interested in some file
+types pass extensions and the list is filtered in Python, so a commit costs
+a single git process however many hooks run.
+"""
+
+import hashlib
+import os
+import subprocess
+import tempfile
+
+
+def _index_path():
+    """Path of the git index for the repository in the current directory."""
+    return os.environ.get('GIT_INDEX_FILE') or os.path.join('.git', 'index')
+
+
+def ext_pathspecs(extensions):
+    """Build case-insensitive git pathspecs matching the given extensions (no dot)."""
+    return tuple(f':(icase)*.{ext}' for ext in sorted(extensions))
+
+
+def _extension(path):
+    """Lowercase extension of path without the dot ('' if it has none)."""
+    dot, _, ext = path.rpartition('.')
+    return ext.lower() if dot else ''
+
+
+def filter_extensions(files, extensions):
+    """Keep the files whose extension (case-insensitive, no dot) is in extensions."""
+    return [f for f in files if _extension(f) in extensions]
+
+
+def _run_git_diff(pathspecs=()):
+    """Ask git for staged file names (NUL-separated to handle any filename)."""
+    result = subprocess.run(
+        ['git', 'diff', '--cached', '--name-only', '--diff-filter=ACMR', '-z',
+         '--', *pathspecs],
+        capture_output=True
+    )
+    output = result.stdout.decode('utf-8', errors='surrogateescape')
+    return [f for f in output.split('\0') if f]
+
+
+def _cache_location():
+    """Return (cache_path, key) for the current index, or None if it can't be stat'd."""
+    index_path = os.path.abspath(_index_path())
+    try:
+        st = os.stat(index_path)
+    except OSError:
+        return None
+
+    # One cache file per repository; its first line records the index state
+    repo_hash = hashlib.sha1(index_path.encode(), usedforsecurity=False).hexdigest()[:12]
+    cache_path = os.path.join(tempfile.gettempdir(), f'prehook_{repo_hash}.lst')
+    return cache_path, f'{st.st_mtime_ns}:{st.st_size}'
+
+
+def _read_cache(cache_path, key):
+    """Return the cached file list if it was recorded for this index state."""
+    try:
+        with open(cache_path, encoding='utf-8', errors='surrogateescape') as f:
+            cached_key, _, names = f.read().partition('\n')
+    except OSError:
+        return None
+    if cached_key != key:
+        return None
+    return [n for n in names.split('\0') if n]
+
+
+def _write_cache(cache_path, key, staged):
+    """Store the file list, atomically so a concurrent hook never reads a partial file."""
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), prefix='prehook_')
+        with os.fdopen(fd, 'w', encoding='utf-8', errors='surrogateescape') as f:
+            f.write(key + '\n' + '\0'.join(staged))
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def has_staged():
+    """Check whether anything is staged (shares the cached list, so later hooks skip git)."""
+    return bool(get_staged_files_cached())
+
+
+def get_staged_files_cached(extensions=None):
+    """
+    Get list of staged files, reusing the result of an earlier hook if the index is unchanged.
+
+    Args:
+        extensions: Optional set of extensions (lowercase, no dot); only
+            matching files are returned.
+    """
+    location = _cache_location()
+    staged = _read_cache(*location) if location else None
+    if staged is None:
+        staged = _run_git_diff()
+        if location:
+            _write_cache(*location, staged)
+
+    if extensions is not None:
+        return filter_extensions(staged, extensions)
+    return staged
+
+
+def get_pushed_files(pathspecs=()):
+    """
+    Get files changed in the commits being pushed, optionally limited to pathspecs.
+
+    pre-commit exports PRE_COMMIT_FROM_REF/PRE_COMMIT_TO_REF for pre-push
+    hooks; returns None when they are not set (i.e. not running as pre-push).
+    """
+    from_ref = os.environ.get('PRE_COMMIT_FROM_REF')
+    to_ref = os.environ.get('PRE_COMMIT_TO_REF')
+    if not from_ref or not to_ref:
+        return None
+
+    result = subprocess.run(
+        ['git', 'diff', '--name-only', '--diff-filter=ACMR', '-z', from_ref, to_ref,
+         '--', *pathspecs],
+        capture_output=True
+    )
+    output = result.stdout.decode('utf-8', errors='surrogateescape')
+    return [f for f in output.split('\0') if f]
@@ -9,11 +9,23 @@ Rule from CLAUDE.md:
 This hook BLOCKS commits to main. No bypass except --no-verify.
 """
 
+import os
 import subprocess
 import sys
 
 def get_current_branch():
     """Get the current git branch name."""
+    # Reading HEAD directly avoids forking git; it is re-read on every call
+    # so the answer is never stale
+    git_dir = os.environ.get('GIT_DIR', '.git')
+    try:
+        with open(os.path.join(git_dir, 'HEAD')) as f:
+            head = f.read().strip()
+        if head.startswith('ref: refs/heads/'):
+            return head[len('ref: refs/heads/'):]
+    except OSError:
+        pass  # e.g. .git is a file in worktrees; let git resolve it
+
     result = subprocess.run(
         ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
         capture_output=True, text=True
@@ -10,44 +10,31 @@ Rule from CLAUDE.md:
 This hook warns when HTML/CSS files are staged.
 """
 
-import subprocess
+import re
 import sys
-from pathlib import Path
 
-# File patterns that require responsive testing
-UI_PATTERNS = {'.html', '.css', '.scss', '.razor', '.cshtml'}
+from _git_cache import get_staged_files_cached, has_staged
 
-# Paths to exclude
-EXCLUDE_PATHS = {
+# File extensions (lowercase, no dot) that require responsive testing
+UI_PATTERNS = frozenset({'html', 'css', 'scss', 'razor', 'cshtml'})
+
+# Paths to exclude (matched anywhere in the file path)
+EXCLUDE_PATHS = (
     'wwwroot/lib/',  # Third-party libraries
     'node_modules/',
     '.github/',
-}
-
-def get_staged_files():
-    """Get list of staged files."""
-    result = subprocess.run(
-        ['git', 'diff', '--cached', '--name-only', '--diff-filter=ACMR'],
-        capture_output=True, text=True
-    )
-    return result.stdout.strip().split('\n') if result.stdout.strip() else []
+)
+EXCLUDE_RE = re.compile('|'.join(map(re.escape, EXCLUDE_PATHS)))
 
 def is_excluded(filepath):
     """Check if file is in an excluded path."""
-    return any(excl in filepath for excl in EXCLUDE_PATHS)
+    return EXCLUDE_RE.search(filepath) is not None
 
 def main():
-    staged = get_staged_files()
-    if not staged:
+    if not has_staged():
         return 0
 
-    ui_files = []
-    for f in staged:
-        if is_excluded(f):
-            continue
-        path = Path(f)
-        if path.suffix.lower() in UI_PATTERNS:
-            ui_files.append(f)
+    ui_files = [f for f in get_staged_files_cached(UI_PATTERNS) if not is_excluded(f)]
 
     if ui_files:
         print("\n" + "=" * 60)
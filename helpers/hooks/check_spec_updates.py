@@ -9,50 +9,45 @@ Rule from CLAUDE.md:
 This hook warns (doesn't block) when code files are staged but specs aren't.
 """
 
-import subprocess
+import re
 import sys
-from pathlib import Path
-
-# File patterns that require TECHNICAL_SPEC.md updates
-CODE_PATTERNS = {
-    '.cs', '.razor', '.cshtml',  # C#
-    '.py',  # Python
-    '.ts', '.tsx', '.js', '.jsx',  # TypeScript/JavaScript
-    '.sql',  # Database
-    '.bicep', '.json',  # Infrastructure (if in infrastructure/)
-}
-
-# File patterns that require FUNCTIONAL_SPEC.md updates (user-facing)
-UI_PATTERNS = {
-    '.html', '.razor', '.cshtml',
-    '.css', '.scss',
-}
-
-# Paths to exclude from checks
-EXCLUDE_PATHS = {
+
+from _git_cache import get_staged_files_cached, has_staged
+
+# File extensions (lowercase, no dot) that require TECHNICAL_SPEC.md updates
+CODE_PATTERNS = frozenset({
+    'cs', 'razor', 'cshtml',  # C#
+    'py',  # Python
+    'ts', 'tsx', 'js', 'jsx',  # TypeScript/JavaScript
+    'sql',  # Database
+    'bicep', 'json',  # Infrastructure (if in infrastructure/)
+})
+
+# File extensions that require FUNCTIONAL_SPEC.md updates (user-facing)
+UI_PATTERNS = frozenset({
+    'html', 'razor', 'cshtml',
+    'css', 'scss',
+})
+
+# Paths to exclude from checks (matched anywhere in the file path)
+EXCLUDE_PATHS = (
     'helpers/hooks/',  # Don't require spec updates for hook changes
     'tests/',
     '.github/',
     '__pycache__/',
-}
-
-def get_staged_files():
-    """Get list of staged files."""
-    result = subprocess.run(
-        ['git', 'diff', '--cached', '--name-only', '--diff-filter=ACMR'],
-        capture_output=True, text=True
-    )
-    return result.stdout.strip().split('\n') if result.stdout.strip() else []
+)
+EXCLUDE_RE = re.compile('|'.join(map(re.escape, EXCLUDE_PATHS)))
 
 def is_excluded(filepath):
     """Check if file is in an excluded path."""
-    return any(excl in filepath for excl in EXCLUDE_PATHS)
+    return EXCLUDE_RE.search(filepath) is not None
 
 def main():
-    staged = get_staged_files()
-    if not staged:
+    if not has_staged():
         return 0
 
+    staged = get_staged_files_cached()
+
     # Categorize staged files
     code_files = []
     ui_files = []
@@ -63,8 +58,8 @@ def main():
         if is_excluded(f):
             continue
 
-        path = Path(f)
-        suffix = path.suffix.lower()
+        dot, _, ext = f.rpartition('.')
+        suffix = ext.lower() if dot else ''
 
         if 'TECHNICAL_SPEC.md' in f:
             has_technical_spec = True
@@ -8,45 +8,88 @@ import os
 import sys
 import time
 import base64
-import urllib.request
+import http.client
 import urllib.error
-import json
 from pathlib import Path
 
+try:
+    from orjson import loads as json_loads  # Faster parsing while polling the build
+except ImportError:
+    from json import loads as json_loads
+
+JENKINS_HOST = "localhost"
+JENKINS_PORT = 8080
+JENKINS_URL = f"http://{JENKINS_HOST}:{JENKINS_PORT}"
+
+ENV_PATH = Path(__file__).resolve().parents[2] / ".env"
+
 # Fix Windows console encoding
 if sys.platform == "win32":
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
 
 
 def load_env():
-    """Load credentials from .env file."""
-    env_path = Path(__file__).parent.parent.parent / ".env"
-    if not env_path.exists():
+    """Load credentials from the environment, falling back to the .env file."""
+    user = os.environ.get("JENKINS_USER")
+    token = os.environ.get("JENKINS_API_TOKEN")
+    if user and token:
+        return user, token
+
+    try:
+        text = ENV_PATH.read_text()
+    except FileNotFoundError:
         return None, None
 
-    user = None
-    token = None
-    with open(env_path) as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith("JENKINS_USER="):
-                user = line.split("=", 1)[1]
-            elif line.startswith("JENKINS_API_TOKEN="):
-                token = line.split("=", 1)[1]
+    values = dict(
+        line.strip().split("=", 1) for line in text.splitlines()
+        if "=" in line and not line.lstrip().startswith("#")
+    )
+    return values.get("JENKINS_USER"), values.get("JENKINS_API_TOKEN")
 
-    return user, token
+
+# One keep-alive connection reused by every request in the hook; http.client
+# reconnects by itself after close()
+JENKINS_CONN = http.client.HTTPConnection(JENKINS_HOST, JENKINS_PORT, timeout=10)
+
+
+def _request(method, path, headers=None):
+    """
+    Send a request over the shared connection and return (status, body).
+
+    Jenkins drops idle keep-alive connections after a few seconds, so a GET
+    that fails on a stale socket is retried once on a fresh connection.
+    """
+    attempts = 2 if method == "GET" else 1
+    for attempt in range(attempts):
+        try:
+            JENKINS_CONN.request(method, path, headers=headers or {})
+            resp = JENKINS_CONN.getresponse()
+            return resp.status, resp.read()  # Always drain so the connection can be reused
+        except (http.client.RemoteDisconnected, ConnectionError):
+            JENKINS_CONN.close()
+            if attempt == attempts - 1:
+                raise
+        except Exception:
+            JENKINS_CONN.close()
+            raise
+
+
+def _get(path, headers=None):
+    return _request("GET", path, headers)
+
+
+def _post(path, headers=None):
+    return _request("POST", path, headers)
 
 
 def check_jenkins_running():
     """Check if Jenkins is accessible (403 means it's running but requires auth)."""
     try:
-        urllib.request.urlopen("http://localhost:8080/", timeout=5)  # nosec B310 - localhost only
-        return True
-    except urllib.error.HTTPError as e:
-        # 403 Forbidden means Jenkins is running but requires auth
-        return e.code == 403
+        status, _ = _get("/")
     except Exception:
         return False
+    # 403 Forbidden means Jenkins is running but requires auth
+    return status < 400 or status == 403
 
 
 def get_auth_header(user, token):
@@ -57,69 +100,63 @@ def get_auth_header(user, token):
 
 
 def get_last_build_number(headers):
-    """Get the current last build number."""
+    """Get the current last build number (0 if the job has never run, None if the lookup failed)."""
     try:
-        req = urllib.request.Request(
-            "http://localhost:8080/job/StockAnalyzer/api/json",
-            headers=headers
-        )
-        with urllib.request.urlopen(req, timeout=10) as resp:  # nosec B310 - localhost only
-            data = json.loads(resp.read().decode())
-            if data.get("lastBuild"):
-                return data["lastBuild"]["number"]
-            return 0
+        # tree= limits the response to the one field we read
+        status, body = _get("/job/StockAnalyzer/api/json?tree=lastBuild[number]", headers)
+        if status != 200:
+            return None
+        data = json_loads(body)
     except Exception:
-        return 0
+        return None
+    if data.get("lastBuild"):
+        return data["lastBuild"]["number"]
+    return 0
 
 
 def trigger_build(headers):
     """Trigger a Jenkins build."""
     try:
-        req = urllib.request.Request(
-            "http://localhost:8080/job/StockAnalyzer/build",
-            method="POST",
-            headers=headers
-        )
-        urllib.request.urlopen(req, timeout=10)  # nosec B310 - localhost only
-        return True
-    except urllib.error.HTTPError as e:
-        # 201 Created is success for build trigger
-        if e.code == 201:
-            return True
-        return False
+        status, _ = _post("/job/StockAnalyzer/build", headers)
     except Exception:
         return False
+    # 201 Created is success for build trigger
+    return status < 400
 
 
 def wait_for_build(headers, build_number, timeout=300):
     """Wait for a build to complete and return success/failure."""
-    url = f"http://localhost:8080/job/StockAnalyzer/{build_number}/api/json"
+    path = f"/job/StockAnalyzer/{build_number}/api/json?tree=building,result"
     start_time = time.time()
 
     while time.time() - start_time < timeout:
         try:
-            req = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(req, timeout=10) as resp:  # nosec B310 - localhost only
-                data = json.loads(resp.read().decode())
-
-                if data.get("building", True):
-                    # Still building
-                    time.sleep(5)
-                    continue
-
-                result = data.get("result")
-                return result == "SUCCESS", result
-
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                # Build not started yet
-                time.sleep(2)
-                continue
-            raise
+            status, body = _get(path, headers)
         except Exception:
             time.sleep(2)
             continue
 
+        if status == 404:
+            # Build not started yet
+            time.sleep(2)
+            continue
+        if status != 200:
+            raise urllib.error.HTTPError(JENKINS_URL + path, status, "", None, None)
+
+        try:
+            data = json_loads(body)
+        except ValueError:
+            time.sleep(2)
+            continue
+
+        if data.get("building", True):
+            # Still building
+            time.sleep(5)
+            continue
+
+        result = data.get("result")
+        return result == "SUCCESS", result
+
     return False, "TIMEOUT"
 
 
@@ -140,6 +177,9 @@ def main():
 
     # Get current last build number
     last_build = get_last_build_number(headers)
+    if last_build is None:
+        print("\033[31m✗ Could not read the last Jenkins build number\033[0m")
+        return 1
 
     print("\033[36m→ Triggering Jenkins CI build...\033[0m")
 
@@ -152,11 +192,16 @@ def main():
     time.sleep(3)
     new_build = get_last_build_number(headers)
 
-    if new_build <= last_build:
+    if new_build is None or new_build <= last_build:
         # Build might be queued, wait a bit more
         time.sleep(5)
         new_build = get_last_build_number(headers)
 
+    if new_build is None:
+        print("\033[31m✗ Could not read the new Jenkins build number\033[0m")
+        print("\033[31m  Push blocked - check Jenkins and push again\033[0m")
+        return 1
+
     if new_build <= last_build:
         print("\033[33m⚠ Could not detect new build - push anyway\033[0m")
         return 0
@@ -1,67 +1,76 @@
 #!/usr/bin/env python3
 """
-Pre-commit hook: Validate markdown links in documentation.
+Pre-push hook: Validate markdown links in documentation.
 
 Rule from CLAUDE.md:
 - Before committing documentation changes, verify all markdown links resolve.
 - Broken links are unacceptable.
 
-This hook runs check_links.py when markdown files are staged.
+This hook runs check_links.py on markdown files changed in the commits being
+pushed. It runs at pre-push rather than pre-commit to keep commits fast; when
+run outside a push it checks staged markdown files instead.
 """
 
+import contextlib
+import io
+import os
 import subprocess
 import sys
 from pathlib import Path
 
-def get_staged_files():
-    """Get list of staged files."""
-    result = subprocess.run(
-        ['git', 'diff', '--cached', '--name-only', '--diff-filter=ACMR'],
-        capture_output=True, text=True
-    )
-    return result.stdout.strip().split('\n') if result.stdout.strip() else []
+from _git_cache import ext_pathspecs, get_pushed_files, get_staged_files_cached, has_staged
 
-def main():
-    staged = get_staged_files()
-    if not staged:
-        return 0
+HELPERS_DIR = Path(__file__).resolve().parent.parent
+CHECK_LINKS_PATH = HELPERS_DIR / 'check_links.py'
+MARKDOWN_EXTENSIONS = frozenset({'md'})
+MARKDOWN_PATHSPECS = ext_pathspecs(MARKDOWN_EXTENSIONS)
 
-    # Check if any markdown files are staged
-    md_files = [f for f in staged if f.lower().endswith('.md')]
+def main():
+    # git filters to markdown files itself
+    md_files = get_pushed_files(MARKDOWN_PATHSPECS)
+    if md_files is None:
+        # Not running as pre-push: fall back to the staged files
+        if not has_staged():
+            return 0
+        md_files = get_staged_files_cached(MARKDOWN_EXTENSIONS)
 
     if not md_files:
         return 0
 
     print(f"\nValidating links in {len(md_files)} markdown file(s)...")
 
-    # Find check_links.py
-    script_dir = Path(__file__).parent.parent
-    check_links = script_dir / 'check_links.py'
-
-    if not check_links.exists():
-        print(f"  Warning: {check_links} not found, skipping link validation")
+    if not os.path.exists(CHECK_LINKS_PATH):
+        print(f"  Warning: {CHECK_LINKS_PATH} not found, skipping link validation")
         return 0
 
-    # Run check_links.py on each staged markdown file
-    failed = False
-    for md_file in md_files:
+    # Check all changed markdown files in one in-process call rather than
+    # paying interpreter startup for a check_links.py subprocess per file
+    sys.path.insert(0, str(HELPERS_DIR))
+    try:
+        import check_links as link_checker
+    except ImportError:
+        link_checker = None
+
+    output = io.StringIO()
+    if link_checker is not None and hasattr(link_checker, 'main'):
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            returncode = link_checker.main(md_files)
+    else:
         result = subprocess.run(
-            [sys.executable, str(check_links), md_file],
+            [sys.executable, str(CHECK_LINKS_PATH), *md_files],
             capture_output=True, text=True
         )
-        if result.returncode != 0:
-            print(f"\n  BROKEN LINKS in {md_file}:")
-            print(result.stdout)
-            if result.stderr:
-                print(result.stderr)
-            failed = True
+        returncode = result.returncode
+        output.write(result.stdout + result.stderr)
 
-    if failed:
+    if returncode != 0:
+        print("\n  BROKEN LINKS:")
+        print(output.getvalue())
         print("\n" + "=" * 60)
         print("ERROR: Broken links detected in documentation")
         print("=" * 60)
-        print("Fix the broken links before committing.")
-        print("To skip this check: git commit --no-verify")
+        print("Fix the broken links before pushing.")
+        print("To skip this check: git push --no-verify")
         print("=" * 60 + "\n")
         return 1
 
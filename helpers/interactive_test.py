@@ -9,11 +9,13 @@ Usage:
     python interactive_test.py analyze http://localhost:5000 AAPL --output result.png
     python interactive_test.py capture-api http://localhost:5000 AAPL
     python interactive_test.py console http://localhost:5000 AAPL
+    python interactive_test.py all http://localhost:5000 AAPL
 
 Commands:
     analyze     Search for a stock and take screenshot of results
     capture-api Capture all API responses during stock analysis
     console     Capture console messages during stock analysis
+    all         Run all three above, sharing a single browser launch
 
 Examples:
     # Analyze AAPL and save screenshot
@@ -28,40 +30,109 @@ Examples:
 
 import argparse
 import sys
+import time
 from datetime import datetime
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError, sync_playwright
 
 
-def analyze_stock(url: str, ticker: str, output: str = None, wait: int = 5000) -> dict:
+# URL fragment of the request the Analyze button sends
+ANALYSIS_PATH = '/analysis'
+
+
+class StockTestSession:
     """
-    Navigate to the app, search for a stock, and capture results.
+    Launches one Chromium instance and reuses it for every capture.
 
-    Args:
-        url: Base URL of the Stock Analyzer app
-        ticker: Stock ticker symbol to analyze
-        output: Output file path for screenshot (default: {ticker}_analysis.png)
-        wait: Wait time in ms after clicking Analyze
+    Each capture runs in a fresh page on the shared browser, so running
+    several views of a ticker pays the browser launch cost only once.
+
+    Usage:
+        with StockTestSession() as session:
+            result = session.analyze(url, "AAPL")
+            responses = session.capture_api(url, "AAPL")
 
-    Returns:
-        dict with status, screenshot path, and any errors found
+    Args:
+        analysis_path: URL fragment identifying the analysis API response
     """
-    if not output:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output = f"{ticker}_analysis_{timestamp}.png"
-
-    result = {
-        "ticker": ticker,
-        "screenshot": output,
-        "status": "success",
-        "error": None,
-        "api_responses": []
-    }
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={"width": 1920, "height": 1080})
-
-        # Capture API responses
+
+    def __init__(self, analysis_path: str = ANALYSIS_PATH):
+        self.analysis_path = analysis_path
+
+    def __enter__(self):
+        self._playwright = sync_playwright().start()
+        self.browser = self._playwright.chromium.launch(headless=True)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.browser.close()
+        self._playwright.stop()
+
+    def _new_page(self):
+        return self.browser.new_page(viewport={"width": 1920, "height": 1080})
+
+    def _search_and_analyze(self, page, url: str, ticker: str, timeout: int = 10000):
+        """
+        Load the app, search for the ticker and run the analysis.
+
+        Returns as soon as the analysis response has arrived and every API
+        request it triggered has finished, or when `timeout` ms have passed.
+        """
+        page.goto(url, wait_until="networkidle")
+        page.fill('input[placeholder*="Search"]', ticker)
+
+        # Track in-flight API requests so we can return once the app goes quiet
+        pending = set()
+        page.on('request', lambda request: pending.add(request) if '/api/' in request.url else None)
+        page.on('requestfinished', pending.discard)
+        page.on('requestfailed', pending.discard)
+
+        deadline = time.monotonic() + timeout / 1000
+        try:
+            with page.expect_response(lambda r: self.analysis_path in r.url, timeout=timeout):
+                page.click('button:has-text("Analyze")')
+        except PlaywrightTimeoutError:
+            print(f"Timed out after {timeout}ms waiting for the analysis response")
+            return
+
+        # Then wait for the secondary requests (info, news) it triggered. They
+        # can end in requestfinished or requestfailed and no single wait covers
+        # both, so yield briefly (the sync API only dispatches events during
+        # Playwright calls) until pending is empty
+        while pending and time.monotonic() < deadline:
+            page.wait_for_timeout(50)
+
+    def analyze(self, url: str, ticker: str, output: str = None, timeout: int = 10000,
+                wait: int = None) -> dict:
+        """
+        Navigate to the app, search for a stock, and capture results.
+
+        Args:
+            url: Base URL of the Stock Analyzer app
+            ticker: Stock ticker symbol to analyze
+            output: Output file path for screenshot (default: {ticker}_analysis.png)
+            timeout: Maximum time in ms to wait for results after clicking Analyze
+            wait: Deprecated alias for timeout
+
+        Returns:
+            dict with status, screenshot path, and any errors found
+        """
+        if wait is not None:
+            timeout = wait
+        if not output:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output = f"{ticker}_analysis_{timestamp}.png"
+
+        result = {
+            "ticker": ticker,
+            "screenshot": output,
+            "status": "success",
+            "error": None,
+            "api_responses": []
+        }
+
+        page = self._new_page()
+
+        # Capture API responses (attached before navigation so none are missed)
         def handle_response(response):
             if '/api/' in response.url:
                 result["api_responses"].append({
@@ -71,20 +142,8 @@ def analyze_stock(url: str, ticker: str, output: str = None, wait: int = 5000) -
 
         page.on('response', handle_response)
 
-        print(f"Loading {url}...")
-        page.goto(url, wait_until="networkidle")
-
-        # Type in search box
-        print(f"Searching for {ticker}...")
-        page.fill('input[placeholder*="Search"]', ticker)
-        page.wait_for_timeout(500)
-
-        # Click Analyze
-        page.click('button:has-text("Analyze")')
-
-        # Wait for results
-        print(f"Waiting for results...")
-        page.wait_for_timeout(wait)
+        print(f"Loading {url}, searching for {ticker} and waiting for results...")
+        self._search_and_analyze(page, url, ticker, timeout)
 
         # Check for error message
         error_el = page.query_selector('text=Error Loading Stock Data')
@@ -98,27 +157,23 @@ def analyze_stock(url: str, ticker: str, output: str = None, wait: int = 5000) -
         page.screenshot(path=output, full_page=True)
         print(f"Screenshot saved: {output}")
 
-        browser.close()
-
-    return result
-
+        page.close()
+        return result
 
-def capture_api_responses(url: str, ticker: str) -> list:
-    """
-    Capture all API responses during stock analysis.
-
-    Args:
-        url: Base URL of the Stock Analyzer app
-        ticker: Stock ticker symbol to analyze
+    def capture_api(self, url: str, ticker: str, timeout: int = 10000) -> list:
+        """
+        Capture all API responses during stock analysis.
 
-    Returns:
-        list of API response dicts with url, status, and body preview
-    """
-    responses = []
+        Args:
+            url: Base URL of the Stock Analyzer app
+            ticker: Stock ticker symbol to analyze
+            timeout: Maximum time in ms to wait for results after clicking Analyze
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={"width": 1920, "height": 1080})
+        Returns:
+            list of API response dicts with url, status, and body preview
+        """
+        responses = []
+        page = self._new_page()
 
         def handle_response(response):
             if '/api/' in response.url:
@@ -133,35 +188,27 @@ def capture_api_responses(url: str, ticker: str) -> list:
                 })
 
         page.on('response', handle_response)
+        self._search_and_analyze(page, url, ticker, timeout)
 
-        page.goto(url, wait_until="networkidle")
-        page.fill('input[placeholder*="Search"]', ticker)
-        page.wait_for_timeout(500)
-        page.click('button:has-text("Analyze")')
-        page.wait_for_timeout(5000)
-
-        browser.close()
+        page.close()
+        return responses
 
-    return responses
+    def capture_console(self, url: str, ticker: str, filter_type: str = None,
+                        timeout: int = 10000) -> list:
+        """
+        Capture console messages during stock analysis.
 
+        Args:
+            url: Base URL of the Stock Analyzer app
+            ticker: Stock ticker symbol to analyze
+            filter_type: Filter by message type (error, warning, log, info)
+            timeout: Maximum time in ms to wait for results after clicking Analyze
 
-def capture_console(url: str, ticker: str, filter_type: str = None) -> list:
-    """
-    Capture console messages during stock analysis.
-
-    Args:
-        url: Base URL of the Stock Analyzer app
-        ticker: Stock ticker symbol to analyze
-        filter_type: Filter by message type (error, warning, log, info)
-
-    Returns:
-        list of console message dicts
-    """
-    messages = []
-
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={"width": 1920, "height": 1080})
+        Returns:
+            list of console message dicts
+        """
+        messages = []
+        page = self._new_page()
 
         def handle_console(msg):
             msg_type = msg.type
@@ -172,16 +219,58 @@ def capture_console(url: str, ticker: str, filter_type: str = None) -> list:
                 })
 
         page.on('console', handle_console)
+        self._search_and_analyze(page, url, ticker, timeout)
 
-        page.goto(url, wait_until="networkidle")
-        page.fill('input[placeholder*="Search"]', ticker)
-        page.wait_for_timeout(500)
-        page.click('button:has-text("Analyze")')
-        page.wait_for_timeout(5000)
+        page.close()
+        return messages
+
+
+def analyze_stock(url: str, ticker: str, output: str = None, timeout: int = 10000,
+                  wait: int = None) -> dict:
+    """Run StockTestSession.analyze in a one-off session (wait is a deprecated alias for timeout)."""
+    with StockTestSession() as session:
+        return session.analyze(url, ticker, output, timeout, wait)
+
+
+def capture_api_responses(url: str, ticker: str, timeout: int = 10000) -> list:
+    """Run StockTestSession.capture_api in a one-off session."""
+    with StockTestSession() as session:
+        return session.capture_api(url, ticker, timeout)
+
+
+def capture_console(url: str, ticker: str, filter_type: str = None, timeout: int = 10000) -> list:
+    """Run StockTestSession.capture_console in a one-off session."""
+    with StockTestSession() as session:
+        return session.capture_console(url, ticker, filter_type, timeout)
 
-        browser.close()
 
-    return messages
+def print_analysis(result: dict):
+    """Print the result of an analyze run."""
+    print(f"\nAnalysis Result:")
+    print(f"  Status: {result['status']}")
+    if result['error']:
+        print(f"  Error: {result['error']}")
+    print(f"  API Responses:")
+    for resp in result['api_responses']:
+        status_marker = "OK" if resp['status'] == 200 else "FAIL"
+        print(f"    [{status_marker}] {resp['status']}: {resp['url']}")
+
+
+def print_api_responses(ticker: str, responses: list):
+    """Print captured API responses, with bodies for failures."""
+    print(f"\nAPI Responses for {ticker}:")
+    for resp in responses:
+        status_marker = "OK" if resp['status'] == 200 else "FAIL"
+        print(f"[{status_marker}] {resp['status']}: {resp['url']}")
+        if resp['status'] != 200:
+            print(f"  Body: {resp['body_preview']}")
+
+
+def print_console(ticker: str, messages: list):
+    """Print captured console messages."""
+    print(f"\nConsole Messages for {ticker}:")
+    for msg in messages:
+        print(f"[{msg['type'].upper()}] {msg['text']}")
 
 
 def main():
@@ -190,22 +279,31 @@ def main():
     )
     subparsers = parser.add_subparsers(dest="command", required=True)
 
+    # Options shared by every command
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--timeout", "-t", type=int, default=10000,
+        help="Maximum time in ms to wait for results after clicking Analyze (default: 10000)"
+    )
+    common.add_argument(
+        "--wait", "-w", type=int, dest="timeout",
+        help="Deprecated alias for --timeout"
+    )
+
     # analyze command
     analyze_parser = subparsers.add_parser(
         "analyze",
+        parents=[common],
         help="Search for a stock and take screenshot of results"
     )
     analyze_parser.add_argument("url", help="Base URL of the app")
     analyze_parser.add_argument("ticker", help="Stock ticker symbol")
     analyze_parser.add_argument("--output", "-o", help="Output screenshot path")
-    analyze_parser.add_argument(
-        "--wait", "-w", type=int, default=5000,
-        help="Wait time in ms after clicking Analyze"
-    )
 
     # capture-api command
     api_parser = subparsers.add_parser(
         "capture-api",
+        parents=[common],
         help="Capture all API responses during stock analysis"
     )
     api_parser.add_argument("url", help="Base URL of the app")
@@ -214,6 +312,7 @@ def main():
     # console command
     console_parser = subparsers.add_parser(
         "console",
+        parents=[common],
         help="Capture console messages during stock analysis"
     )
     console_parser.add_argument("url", help="Base URL of the app")
@@ -223,33 +322,31 @@ def main():
         help="Filter by message type (error, warning, log, info)"
     )
 
+    # all command
+    all_parser = subparsers.add_parser(
+        "all",
+        parents=[common],
+        help="Run analyze, capture-api and console with one browser launch"
+    )
+    all_parser.add_argument("url", help="Base URL of the app")
+    all_parser.add_argument("ticker", help="Stock ticker symbol")
+    all_parser.add_argument("--output", "-o", help="Output screenshot path")
+    all_parser.add_argument(
+        "--filter", "-f",
+        help="Filter console messages by type (error, warning, log, info)"
+    )
+
     args = parser.parse_args()
 
-    if args.command == "analyze":
-        result = analyze_stock(args.url, args.ticker, args.output, args.wait)
-        print(f"\nAnalysis Result:")
-        print(f"  Status: {result['status']}")
-        if result['error']:
-            print(f"  Error: {result['error']}")
-        print(f"  API Responses:")
-        for resp in result['api_responses']:
-            status_marker = "OK" if resp['status'] == 200 else "FAIL"
-            print(f"    [{status_marker}] {resp['status']}: {resp['url']}")
-
-    elif args.command == "capture-api":
-        responses = capture_api_responses(args.url, args.ticker)
-        print(f"\nAPI Responses for {args.ticker}:")
-        for resp in responses:
-            status_marker = "OK" if resp['status'] == 200 else "FAIL"
-            print(f"[{status_marker}] {resp['status']}: {resp['url']}")
-            if resp['status'] != 200:
-                print(f"  Body: {resp['body_preview']}")
-
-    elif args.command == "console":
-        messages = capture_console(args.url, args.ticker, args.filter)
-        print(f"\nConsole Messages for {args.ticker}:")
-        for msg in messages:
-            print(f"[{msg['type'].upper()}] {msg['text']}")
+    with StockTestSession() as session:
+        if args.command in ("analyze", "all"):
+            print_analysis(session.analyze(args.url, args.ticker, args.output, args.timeout))
+
+        if args.command in ("capture-api", "all"):
+            print_api_responses(args.ticker, session.capture_api(args.url, args.ticker, args.timeout))
+
+        if args.command in ("console", "all"):
+            print_console(args.ticker, session.capture_console(args.url, args.ticker, args.filter, args.timeout))
 
 
 if __name__ == "__main__":
@@ -7,76 +7,101 @@ Tests for thread contention and response time degradation under load.
 import argparse
 import asyncio
 import aiohttp
+import numpy as np
+import sys
 import time
-import statistics
-from collections import defaultdict
+from collections import Counter
 
 
-async def fetch(session: aiohttp.ClientSession, url: str, results: list):
-    """Make a single request and record timing."""
+# One fixed-width row per request, preallocated for the whole run
+RESULT_DTYPE = np.dtype([
+    ("url_id", np.int16),    # Index into the run's URL list
+    ("status", np.int16),    # HTTP status, 0 when the request failed
+    ("time_ms", np.float64),
+    ("bytes", np.int64),
+    ("error", np.bool_),
+])
+
+
+async def fetch(session: aiohttp.ClientSession, url: str, url_id: int, idx: int, results: np.ndarray,
+                error_messages: Counter):
+    """Make a single request and record timing in row `idx` of results (failures also in error_messages)."""
     start = time.perf_counter()
     try:
         async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
-            await response.read()
+            # Drain the body in chunks to time the last byte without holding
+            # whole (image) payloads in memory
+            total_bytes = 0
+            async for chunk in response.content.iter_chunked(65536):
+                total_bytes += len(chunk)
             elapsed = (time.perf_counter() - start) * 1000  # ms
-            results.append({
-                "url": url,
-                "status": response.status,
-                "time_ms": elapsed,
-                "error": None
-            })
+            results[idx] = (url_id, response.status, elapsed, total_bytes, False)
     except Exception as e:
         elapsed = (time.perf_counter() - start) * 1000
-        results.append({
-            "url": url,
-            "status": 0,
-            "time_ms": elapsed,
-            "error": str(e)
-        })
+        results[idx] = (url_id, 0, elapsed, 0, True)
+        error_messages[str(e) or type(e).__name__] += 1  # Timeouts have an empty message
 
 
 async def run_load_test(base_url: str, endpoints: list, concurrency: int, requests_per_endpoint: int):
-    """Run concurrent requests against multiple endpoints."""
-    results = []
-
-    connector = aiohttp.TCPConnector(limit=concurrency * 2)
+    """
+    Run concurrent requests against multiple endpoints.
+
+    Returns (results, urls, total_time, error_messages), where results is a
+    RESULT_DTYPE array, each row's url_id indexes into urls, and
+    error_messages counts failed requests by error message.
+    """
+    urls = [f"{base_url}{endpoint}" for endpoint in endpoints]
+    results = np.zeros(len(urls) * requests_per_endpoint, dtype=RESULT_DTYPE)
+    error_messages = Counter()
+
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=concurrency)
     async with aiohttp.ClientSession(connector=connector) as session:
-        tasks = []
-        for endpoint in endpoints:
-            url = f"{base_url}{endpoint}"
-            for _ in range(requests_per_endpoint):
-                tasks.append(fetch(session, url, results))
-
-        print(f"Starting {len(tasks)} requests ({concurrency} concurrent)...")
+        # Queue every request up front; only `concurrency` workers consume it,
+        # so there are never more than that many coroutines in flight
+        queue = asyncio.Queue()
+        idx = 0
+        for _ in range(requests_per_endpoint):
+            for url_id in range(len(urls)):
+                queue.put_nowait((idx, url_id))
+                idx += 1
+
+        print(f"Starting {queue.qsize()} requests ({concurrency} concurrent)...")
         start = time.perf_counter()
 
-        # Run with semaphore to control concurrency
-        semaphore = asyncio.Semaphore(concurrency)
-
-        async def bounded_fetch(task):
-            async with semaphore:
-                return await task
-
-        await asyncio.gather(*[bounded_fetch(t) for t in tasks])
+        async def worker():
+            while True:
+                try:
+                    idx, url_id = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                await fetch(session, urls[url_id], url_id, idx, results, error_messages)
+
+        if sys.version_info >= (3, 11):
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(concurrency):
+                    tg.create_task(worker())
+        else:
+            await asyncio.gather(*[worker() for _ in range(concurrency)])
 
         total_time = time.perf_counter() - start
 
-    return results, total_time
+    return results, urls, total_time, error_messages
 
 
-def analyze_results(results: list, total_time: float):
+def analyze_results(results: np.ndarray, urls: list, total_time: float, error_messages: Counter = None):
     """Analyze and print results."""
-    by_endpoint = defaultdict(list)
-    for r in results:
-        by_endpoint[r["url"]].append(r)
+    errors = results["error"]
+    url_ids = results["url_id"]
+    request_counts = np.bincount(url_ids, minlength=len(urls))
+    error_counts = np.bincount(url_ids[errors], minlength=len(urls))
 
     print("\n" + "=" * 70)
     print("LOAD TEST RESULTS")
     print("=" * 70)
 
     total_requests = len(results)
-    total_errors = sum(1 for r in results if r["error"])
-    all_times = [r["time_ms"] for r in results if not r["error"]]
+    total_errors = int(np.count_nonzero(errors))
+    all_times = results["time_ms"][~errors]
 
     print(f"\nOverall:")
     print(f"  Total requests:    {total_requests}")
@@ -84,35 +109,43 @@ def analyze_results(results: list, total_time: float):
     print(f"  Total time:        {total_time:.2f}s")
     print(f"  Requests/sec:      {total_requests/total_time:.1f}")
 
-    if all_times:
+    if error_messages:
+        print(f"\nErrors by message:")
+        for message, count in error_messages.most_common():
+            print(f"  {count:>6}x  {message}")
+
+    if all_times.size:
+        # P95/P99 pick an actual sample, sorted(times)[int(n * q)] as in earlier
+        # runs ("higher" gives exactly that index for these quantiles); the
+        # median is interpolated like statistics.median
+        p50 = np.median(all_times)
+        p95, p99 = np.percentile(all_times, [95, 99], method="higher")
         print(f"\nResponse Times (successful requests):")
-        print(f"  Min:               {min(all_times):.1f}ms")
-        print(f"  Max:               {max(all_times):.1f}ms")
-        print(f"  Mean:              {statistics.mean(all_times):.1f}ms")
-        print(f"  Median:            {statistics.median(all_times):.1f}ms")
-        print(f"  Std Dev:           {statistics.stdev(all_times) if len(all_times) > 1 else 0:.1f}ms")
-        print(f"  P95:               {sorted(all_times)[int(len(all_times)*0.95)]:.1f}ms")
-        print(f"  P99:               {sorted(all_times)[int(len(all_times)*0.99)]:.1f}ms")
+        print(f"  Min:               {all_times.min():.1f}ms")
+        print(f"  Max:               {all_times.max():.1f}ms")
+        print(f"  Mean:              {all_times.mean():.1f}ms")
+        print(f"  Median:            {p50:.1f}ms")
+        print(f"  Std Dev:           {all_times.std(ddof=1) if all_times.size > 1 else 0:.1f}ms")
+        print(f"  P95:               {p95:.1f}ms")
+        print(f"  P99:               {p99:.1f}ms")
 
     print(f"\nPer Endpoint:")
-    for url, endpoint_results in sorted(by_endpoint.items()):
-        times = [r["time_ms"] for r in endpoint_results if not r["error"]]
-        errors = sum(1 for r in endpoint_results if r["error"])
+    ok_url_ids = url_ids[~errors]
+    for url_id, url in sorted(enumerate(urls), key=lambda item: item[1]):
+        times = all_times[ok_url_ids == url_id]
         endpoint_name = url.split("/")[-1] or url.split("/")[-2]
 
         print(f"\n  {endpoint_name}:")
-        print(f"    Requests: {len(endpoint_results)}, Errors: {errors}")
-        if times:
-            print(f"    Mean: {statistics.mean(times):.1f}ms, P95: {sorted(times)[int(len(times)*0.95)]:.1f}ms")
+        print(f"    Requests: {request_counts[url_id]}, Errors: {error_counts[url_id]}")
+        if times.size:
+            print(f"    Mean: {times.mean():.1f}ms, P95: {np.percentile(times, 95, method='higher'):.1f}ms")
 
     # Check for contention indicators
     print("\n" + "-" * 70)
     print("CONTENTION ANALYSIS")
     print("-" * 70)
 
-    if all_times:
-        p50 = statistics.median(all_times)
-        p99 = sorted(all_times)[int(len(all_times)*0.99)]
+    if all_times.size:
         ratio = p99 / p50 if p50 > 0 else 0
 
         if ratio > 10:
@@ -122,8 +155,8 @@ def analyze_results(results: list, total_time: float):
         else:
             print(f"  OK: P99/P50 ratio ({ratio:.1f}x) looks healthy")
 
-        if max(all_times) > 5000:
-            print(f"  WARNING: Max response time {max(all_times):.0f}ms exceeds 5s")
+        if all_times.max() > 5000:
+            print(f"  WARNING: Max response time {all_times.max():.0f}ms exceeds 5s")
 
         if total_errors > total_requests * 0.01:
             print(f"  WARNING: Error rate {total_errors/total_requests*100:.1f}% exceeds 1%")
@@ -179,11 +212,11 @@ def main():
     print(f"Concurrency: {args.concurrency}, Requests per endpoint: {args.requests}")
     print(f"Endpoints: {len(endpoints)}")
 
-    results, total_time = asyncio.run(
+    results, urls, total_time, error_messages = asyncio.run(
         run_load_test(args.url, endpoints, args.concurrency, args.requests)
     )
 
-    analyze_results(results, total_time)
+    analyze_results(results, urls, total_time, error_messages)
 
 
 if __name__ == "__main__":
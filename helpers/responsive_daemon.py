@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+"""
+Responsive Test Daemon - Warm Browser for responsive_test.py
+
+Keeps one Chromium instance running and serves responsive test requests over
+a local socket, so repeated responsive_test.py runs skip the browser cold
+start. responsive_test.py uses the daemon automatically when it is running and
+launches its own browser otherwise.
+
+Usage:
+    python helpers/responsive_daemon.py           # Run in the foreground (Ctrl+C to stop)
+    python helpers/responsive_daemon.py start     # Start in the background
+    python helpers/responsive_daemon.py stop      # Stop the background daemon
+    python helpers/responsive_daemon.py status    # Check whether it is running
+
+Protocol: the client sends one JSON line {"token", "url", "output_dir",
+"prefix", "image_format", "layout_only"} and receives one JSON line with the
+per-viewport results. {"token", "command": "pid"} returns {"pid"} instead,
+and {"token", "command": "shutdown"} makes the daemon close its browser and
+exit cleanly (used by "stop").
+The token is generated at startup and stored in a file only the current
+user can read, so other local processes can't make the daemon write files.
+The socket, PID and token files live in a per-user directory (mode 0700):
+$XDG_RUNTIME_DIR/responsive_daemon, or responsive-<user> in the temp dir.
+"""
+
+import argparse
+import asyncio
+import getpass
+import hmac
+import json
+import os
+import secrets
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+def _default_runtime_dir() -> str:
+    """Per-user directory for the daemon's files, so other users can't pre-create them."""
+    xdg_runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if xdg_runtime and os.path.isdir(xdg_runtime):
+        return os.path.join(xdg_runtime, "responsive_daemon")
+    user = os.getuid() if hasattr(os, "getuid") else getpass.getuser()
+    return os.path.join(tempfile.gettempdir(), f"responsive-{user}")
+
+
+RUNTIME_DIR = _default_runtime_dir()
+
+# Unix socket where available; Windows has no AF_UNIX support in asyncio
+if sys.platform == "win32":
+    DAEMON_ADDRESS = ("127.0.0.1", 47311)
+else:
+    DAEMON_ADDRESS = os.path.join(RUNTIME_DIR, "responsive.sock")
+
+PID_FILE = os.path.join(RUNTIME_DIR, "responsive_daemon.pid")
+TOKEN_FILE = os.path.join(RUNTIME_DIR, "responsive_daemon.token")
+
+CONNECT_TIMEOUT = 1
+RESPONSE_TIMEOUT = 120
+STARTUP_TIMEOUT = 30
+SHUTDOWN_TIMEOUT = 10
+
+
+def _ensure_runtime_dir():
+    """
+    Create RUNTIME_DIR with mode 0700 if needed and check it is safe to use.
+
+    Raises:
+        OSError: If the directory is a symlink, belongs to another user or is
+            accessible to other users
+    """
+    os.makedirs(RUNTIME_DIR, mode=0o700, exist_ok=True)
+    if not hasattr(os, "getuid"):
+        return  # Windows: the temp dir is already per-user
+    st = os.lstat(RUNTIME_DIR)
+    if os.path.islink(RUNTIME_DIR) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise OSError(f"Refusing to use {RUNTIME_DIR}: not a private directory owned by this user")
+
+
+def _connect(timeout: float = CONNECT_TIMEOUT) -> socket.socket:
+    """Open a client connection to the daemon (raises OSError if it isn't running)."""
+    if isinstance(DAEMON_ADDRESS, tuple):
+        return socket.create_connection(DAEMON_ADDRESS, timeout=timeout)
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(DAEMON_ADDRESS)
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _read_token():
+    """Read the running daemon's token (None if there is no daemon or the directory is unsafe)."""
+    try:
+        _ensure_runtime_dir()
+        with open(TOKEN_FILE) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _write_token() -> str:
+    """Generate a fresh token and store it readable by the current user only."""
+    token = secrets.token_hex(16)
+    # O_EXCL on a fresh file, so a file left by anyone else is never reused as-is
+    if os.path.lexists(TOKEN_FILE):
+        os.unlink(TOKEN_FILE)
+    fd = os.open(TOKEN_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(token)
+    return token
+
+
+def _send(message: dict, timeout: float):
+    """Send one message to the daemon and return its reply (None if it can't be reached)."""
+    token = _read_token()
+    if token is None:
+        return None
+    try:
+        sock = _connect()
+    except OSError:
+        return None
+
+    try:
+        with sock:
+            sock.settimeout(timeout)
+            sock.sendall(json.dumps({"token": token, **message}).encode() + b"\n")
+            with sock.makefile("rb") as f:
+                line = f.readline()
+    except OSError:  # Includes timeouts: the daemon is hung or went away mid-request
+        return None
+    if not line:
+        return None
+    return json.loads(line)
+
+
+def _daemon_pid():
+    """Ask the running daemon for its process ID (None if it doesn't answer)."""
+    reply = _send({"command": "pid"}, CONNECT_TIMEOUT)
+    return reply.get("pid") if reply else None
+
+
+def request_screenshots(url: str, output_dir: str, prefix: str = None, image_format: str = "jpeg",
+                        layout_only: bool = False):
+    """
+    Ask a running daemon to test a URL.
+
+    Args:
+        url: The URL to test
+        output_dir: Directory to save screenshots (resolved against our cwd)
+        prefix: Optional prefix for screenshot filenames
+        image_format: Screenshot format, "jpeg" or "png"
+        layout_only: Skip images, fonts and streams
+
+    Returns:
+        dict with results for each viewport, or None if no daemon is running
+    """
+    message = {
+        "url": url,
+        "output_dir": os.path.abspath(output_dir),
+        "prefix": prefix,
+        "image_format": image_format,
+        "layout_only": layout_only,
+    }
+    return _send(message, RESPONSE_TIMEOUT)
+
+
+async def _handle_client(browser, token, shutdown, reader, writer):
+    """Run one responsive test request on the shared browser (or a pid/shutdown command)."""
+    from responsive_test import run_responsive
+
+    try:
+        line = await reader.readline()
+        if not line:
+            return
+        message = json.loads(line)
+        if not hmac.compare_digest(str(message.get("token", "")), token):
+            print("Rejected request with a missing or wrong token", flush=True)
+            return
+        if message.get("command") == "pid":
+            writer.write(json.dumps({"pid": os.getpid()}).encode() + b"\n")
+            await writer.drain()
+            return
+        if message.get("command") == "shutdown":
+            print("Shutdown requested", flush=True)
+            writer.write(json.dumps({"pid": os.getpid()}).encode() + b"\n")
+            await writer.drain()
+            shutdown.set()
+            return
+        print(f"Testing {message['url']}", flush=True)
+        results = await run_responsive(
+            browser, message["url"], message.get("output_dir", "."),
+            message.get("prefix"), verbose=False,
+            image_format=message.get("image_format", "jpeg"),
+            layout_only=message.get("layout_only", False)
+        )
+        writer.write(json.dumps(results).encode() + b"\n")
+        await writer.drain()
+    except Exception as e:
+        print(f"Request failed: {e}", flush=True)
+    finally:
+        writer.close()
+
+
+async def serve():
+    """Launch the browser and serve requests until interrupted."""
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        token = _write_token()
+
+        # Set by the shutdown command (or SIGTERM where asyncio can catch it),
+        # so the browser and runtime files are always cleaned up
+        shutdown = asyncio.Event()
+        if sys.platform != "win32":
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, shutdown.set)
+
+        async def handler(reader, writer):
+            await _handle_client(browser, token, shutdown, reader, writer)
+
+        if isinstance(DAEMON_ADDRESS, tuple):
+            server = await asyncio.start_server(handler, *DAEMON_ADDRESS)
+        else:
+            # Remove a stale socket left by a daemon that didn't shut down cleanly
+            # (main() has already checked that no daemon is answering on it)
+            if os.path.exists(DAEMON_ADDRESS):
+                os.unlink(DAEMON_ADDRESS)
+            server = await asyncio.start_unix_server(handler, DAEMON_ADDRESS)
+
+        print(f"Responsive test daemon listening on {DAEMON_ADDRESS}", flush=True)
+        try:
+            async with server:
+                await shutdown.wait()
+        finally:
+            await browser.close()
+            if not isinstance(DAEMON_ADDRESS, tuple) and os.path.exists(DAEMON_ADDRESS):
+                os.unlink(DAEMON_ADDRESS)
+            if _read_token() == token:
+                os.unlink(TOKEN_FILE)
+            _remove_pid_file(os.getpid())
+
+
+def _remove_pid_file(pid: int):
+    """Remove PID_FILE if it records pid."""
+    try:
+        with open(PID_FILE) as f:
+            recorded = int(f.read().strip())
+    except (OSError, ValueError):
+        return
+    if recorded == pid:
+        os.unlink(PID_FILE)
+
+
+def is_running() -> bool:
+    """Check whether a daemon is accepting connections."""
+    try:
+        _connect().close()
+        return True
+    except OSError:
+        return False
+
+
+def start_daemon() -> int:
+    """Start the daemon as a detached background process and wait until it is ready."""
+    if is_running():
+        print("Responsive test daemon already running")
+        return 0
+
+    try:
+        _ensure_runtime_dir()
+    except OSError as e:
+        print(f"Error: {e}")
+        return 1
+
+    cmd = [sys.executable, os.path.abspath(__file__), "run"]
+    if sys.platform == "win32":
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            creationflags=subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.DETACHED_PROCESS,
+        )
+    else:
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True
+        )
+
+    with open(PID_FILE, "w") as f:
+        f.write(str(process.pid))
+
+    # Chromium takes a moment to launch; report ready only once it's serving
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if is_running():
+            print(f"Started responsive test daemon (PID: {process.pid})")
+            return 0
+        if process.poll() is not None:
+            break
+        time.sleep(0.2)
+
+    process.kill()
+    os.unlink(PID_FILE)
+    print("Failed to start responsive test daemon - run it in the foreground to see errors")
+    return 1
+
+
+def stop_daemon() -> int:
+    """
+    Stop a running daemon, whether started with 'start' or in the foreground.
+
+    Asks it to shut down over the authenticated socket so it closes Chromium
+    and removes its files; a signal is only sent if it doesn't exit in time.
+    On Windows that signal is TerminateProcess, which skips the cleanup.
+    """
+    # Only a PID the daemon reports itself is ever signalled, never one read
+    # from a possibly stale PID file
+    reply = _send({"command": "shutdown"}, CONNECT_TIMEOUT)
+    if reply is None:
+        if os.path.exists(PID_FILE):
+            os.unlink(PID_FILE)
+        print("Responsive test daemon not running")
+        return 0
+
+    pid = reply.get("pid")
+    deadline = time.monotonic() + SHUTDOWN_TIMEOUT
+    while is_running() and time.monotonic() < deadline:
+        time.sleep(0.2)
+
+    if is_running():
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            pass
+        print(f"Responsive test daemon did not shut down; terminated it (PID: {pid})")
+        _remove_pid_file(pid)
+        if os.path.exists(TOKEN_FILE):
+            os.unlink(TOKEN_FILE)
+    else:
+        print(f"Stopped responsive test daemon (PID: {pid})")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Keep a warm browser for responsive_test.py",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument(
+        "command",
+        nargs="?",
+        default="run",
+        choices=["run", "start", "stop", "status"],
+        help="run in the foreground (default), or start/stop/check a background daemon"
+    )
+    args = parser.parse_args()
+
+    if args.command == "start":
+        return start_daemon()
+    if args.command == "stop":
+        return stop_daemon()
+    if args.command == "status":
+        print(f"Responsive test daemon: {'RUNNING' if is_running() else 'STOPPED'}")
+        return 0
+
+    try:
+        import playwright  # noqa: F401
+    except ImportError:
+        print("Error: playwright not installed. Run: pip install playwright && playwright install")
+        return 1
+
+    # Starting a second daemon would take over the socket of the live one
+    if is_running():
+        print("Responsive test daemon already running")
+        return 1
+
+    try:
+        _ensure_runtime_dir()
+    except OSError as e:
+        print(f"Error: {e}")
+        return 1
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        print("\nDaemon stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
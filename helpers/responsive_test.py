@@ -8,21 +8,26 @@ Tests web pages at three viewport sizes:
 - Desktop (1400x900) - Standard laptop
 
 Usage:
-    python helpers/responsive_test.py <url> [--output-dir <dir>] [--prefix <name>]
+    python helpers/responsive_test.py <url> [--output-dir <dir>] [--prefix <name>] [--format png|jpeg]
     python helpers/responsive_test.py http://localhost:5000/docs.html
     python helpers/responsive_test.py http://localhost:5000/docs.html --prefix docs
     python helpers/responsive_test.py http://localhost:5000/ --output-dir screenshots
+    python helpers/responsive_test.py --serve    # Reuse one browser for URLs read from stdin
+
+Run "python helpers/responsive_daemon.py start" to keep a browser warm between
+runs; this script uses it automatically when it is running.
 
 The script saves screenshots for each viewport and reports any JavaScript errors.
 """
 
 import argparse
+import asyncio
 import sys
 from pathlib import Path
 from datetime import datetime
 
 try:
-    from playwright.sync_api import sync_playwright
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
 except ImportError:
     print("Error: playwright not installed. Run: pip install playwright && playwright install")
     sys.exit(1)
@@ -34,65 +39,133 @@ VIEWPORTS = {
     'desktop': {'width': 1400, 'height': 900, 'device_scale_factor': 1},
 }
 
+# Screenshot formats; JPEG is much smaller and faster to encode, PNG is lossless
+IMAGE_FORMATS = {'jpeg': 'jpg', 'png': 'png'}
+JPEG_QUALITY = 80
 
-def test_responsive(url: str, output_dir: str = '.', prefix: str = None, verbose: bool = True):
-    """
-    Test a URL at all three viewport sizes.
+# Resource types that never affect layout; aborted so they can't hold up the load.
+# Fonts are still loaded since they change text metrics.
+SKIPPED_RESOURCE_TYPES = frozenset({'media', 'other'})
 
-    Args:
-        url: The URL to test
-        output_dir: Directory to save screenshots
-        prefix: Optional prefix for screenshot filenames
-        verbose: Print progress messages
+# With --layout-only, also skip everything but HTML, CSS and scripts. Images
+# render as empty boxes and text uses fallback fonts.
+LAYOUT_ONLY_SKIPPED_RESOURCE_TYPES = SKIPPED_RESOURCE_TYPES | {'image', 'font', 'websocket', 'eventsource'}
 
-    Returns:
-        dict with results for each viewport
+
+def _resource_filter(skipped_types: frozenset, aborted_urls: set):
     """
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
+    Build a route handler that aborts requests for the given resource types.
 
-    # Generate prefix from URL if not provided
-    if not prefix:
-        # Extract page name from URL
-        from urllib.parse import urlparse
-        parsed = urlparse(url)
-        path = parsed.path.strip('/')
-        if path:
-            prefix = path.replace('/', '_').replace('.html', '').replace('.', '_')
+    Aborted URLs are added to aborted_urls so the "Failed to load resource"
+    console errors Chromium logs for them can be told apart from real ones.
+    """
+    async def route_handler(route):
+        if route.request.resource_type in skipped_types:
+            aborted_urls.add(route.request.url)
+            await route.abort()
         else:
-            prefix = 'index'
+            await route.continue_()
+    return route_handler
+
+
+def _default_prefix(url: str) -> str:
+    """Generate a screenshot filename prefix from the URL path."""
+    from urllib.parse import urlparse
+    parsed = urlparse(url)
+    path = parsed.path.strip('/')
+    if path:
+        return path.replace('/', '_').replace('.html', '').replace('.', '_')
+    return 'index'
+
+
+async def _load_page(page, url: str):
+    """Navigate to the URL and wait until the layout is stable."""
+    # Layout is stable once the load event has fired and web fonts are in;
+    # waiting for network idle would also wait on trailing XHRs and beacons
+    await page.goto(url, wait_until='domcontentloaded', timeout=30000)
+    try:
+        await page.wait_for_load_state('load', timeout=10000)
+    except PlaywrightTimeoutError:
+        pass  # Screenshot whatever has rendered rather than failing the viewport
+    await page.evaluate('document.fonts.ready.then(() => true)')
+
+
+def _screenshot_options(image_format: str) -> dict:
+    """page.screenshot() options for the given format, with animations and caret frozen."""
+    options = {'type': image_format, 'full_page': False, 'animations': 'disabled', 'caret': 'hide'}
+    if image_format == 'jpeg':
+        # Quick-look captures: CSS-pixel size keeps 2x viewports small
+        options.update(quality=JPEG_QUALITY, scale='css')
+    return options
+
+
+async def _run_viewport_group(browser, url: str, output_path: Path, prefix: str,
+                              viewports: list, verbose: bool, image_format: str = 'jpeg',
+                              layout_only: bool = False):
+    """
+    Screenshot the URL at several viewport sizes that share a device scale factor.
 
-    results = {}
-    js_errors = []
+    The page is loaded once in a single context and resized between
+    screenshots, so it is only downloaded once per group.
+    """
+    first_config = viewports[0][1]
+    context = await browser.new_context(
+        viewport={'width': first_config['width'], 'height': first_config['height']},
+        device_scale_factor=first_config.get('device_scale_factor', 1)
+    )
+    skipped_types = LAYOUT_ONLY_SKIPPED_RESOURCE_TYPES if layout_only else SKIPPED_RESOURCE_TYPES
+    aborted_urls = set()
+    await context.route('**/*', _resource_filter(skipped_types, aborted_urls))
+    page = await context.new_page()
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
+    # Collect JavaScript errors, each distinct message once (dev builds tend to
+    # repeat them); rebound for each viewport below so errors are reported
+    # against the size they happened at
+    viewport_errors = []
+    seen_errors = set()
 
-        for viewport_name, viewport_config in VIEWPORTS.items():
-            if verbose:
-                print(f"Testing {viewport_name} ({viewport_config['width']}x{viewport_config['height']})...")
+    def record_error(text):
+        if text not in seen_errors:
+            seen_errors.add(text)
+            viewport_errors.append(text)
+
+    def on_page_error(err):
+        record_error(str(err))
+
+    def on_console(msg):
+        # Requests we aborted on purpose are reported as load failures; not a page bug
+        if msg.type == 'error' and msg.location.get('url') not in aborted_urls:
+            record_error(f"Console {msg.type}: {msg.text}")
 
-            context = browser.new_context(
-                viewport={'width': viewport_config['width'], 'height': viewport_config['height']},
-                device_scale_factor=viewport_config.get('device_scale_factor', 1)
-            )
-            page = context.new_page()
+    page.on('pageerror', on_page_error)
+    page.on('console', on_console)
 
-            # Collect JavaScript errors
-            viewport_errors = []
-            page.on('pageerror', lambda err: viewport_errors.append(str(err)))
-            page.on('console', lambda msg: viewport_errors.append(f"Console {msg.type}: {msg.text}") if msg.type == 'error' else None)
+    results = {}
+    loaded = False
+    try:
+        for viewport_name, viewport_config in viewports:
+            if verbose:
+                print(f"Testing {viewport_name} ({viewport_config['width']}x{viewport_config['height']})...")
+            viewport_errors, seen_errors = [], set()
 
             try:
-                page.goto(url, wait_until='networkidle', timeout=30000)
+                if not loaded:
+                    await _load_page(page, url)
+                    loaded = True
+                else:
+                    await page.set_viewport_size(
+                        {'width': viewport_config['width'], 'height': viewport_config['height']}
+                    )
+                    # Give the page a frame to re-layout at the new size
+                    await page.evaluate('new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)))')
 
                 # Take screenshot
-                screenshot_name = f"{prefix}_{viewport_name}.png"
+                screenshot_name = f"{prefix}_{viewport_name}.{IMAGE_FORMATS[image_format]}"
                 screenshot_path = output_path / screenshot_name
-                page.screenshot(path=str(screenshot_path), full_page=False)
+                await page.screenshot(path=str(screenshot_path), **_screenshot_options(image_format))
 
                 # Get page title for verification
-                title = page.title()
+                title = await page.title()
 
                 results[viewport_name] = {
                     'status': 'success',
@@ -102,13 +175,10 @@ def test_responsive(url: str, output_dir: str = '.', prefix: str = None, verbose
                     'js_errors': viewport_errors if viewport_errors else None
                 }
 
-                if viewport_errors:
-                    js_errors.extend([(viewport_name, err) for err in viewport_errors])
-
                 if verbose:
-                    print(f"  [OK] Screenshot saved: {screenshot_path}")
+                    print(f"  [OK] {viewport_name} screenshot saved: {screenshot_path}")
                     if viewport_errors:
-                        print(f"  [WARN] {len(viewport_errors)} JS error(s) detected")
+                        print(f"  [WARN] {viewport_name}: {len(viewport_errors)} JS error(s) detected")
 
             except Exception as e:
                 results[viewport_name] = {
@@ -117,31 +187,169 @@ def test_responsive(url: str, output_dir: str = '.', prefix: str = None, verbose
                     'viewport': f"{viewport_config['width']}x{viewport_config['height']}"
                 }
                 if verbose:
-                    print(f"  [FAIL] Error: {e}")
+                    print(f"  [FAIL] {viewport_name} error: {e}")
 
-            finally:
-                context.close()
+    finally:
+        await context.close()
 
-        browser.close()
+    return results
 
-    # Summary
-    if verbose:
-        print("\n" + "=" * 50)
-        print("RESPONSIVE TEST SUMMARY")
-        print("=" * 50)
-        success_count = sum(1 for r in results.values() if r['status'] == 'success')
-        print(f"Passed: {success_count}/{len(VIEWPORTS)}")
 
-        if js_errors:
-            print(f"\nJavaScript Errors ({len(js_errors)}):")
-            for viewport, error in js_errors:
-                print(f"  [{viewport}] {error[:100]}...")
+async def run_responsive(browser, url: str, output_dir: str = '.', prefix: str = None, verbose: bool = True,
+                         image_format: str = 'jpeg', layout_only: bool = False):
+    """
+    Test a URL at all three viewport sizes using an already-launched browser.
 
-        print(f"\nScreenshots saved to: {output_path.absolute()}")
+    Viewports are grouped by device scale factor; each group loads the page
+    once and the groups run concurrently.
+
+    Args:
+        browser: Playwright async Browser to open contexts in
+        url: The URL to test
+        output_dir: Directory to save screenshots
+        prefix: Optional prefix for screenshot filenames
+        verbose: Print progress messages
+        image_format: Screenshot format, 'jpeg' or 'png'
+        layout_only: Skip images, fonts and streams for a faster structural check
+
+    Returns:
+        dict with results for each viewport
+    """
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    # Generate prefix from URL if not provided
+    if not prefix:
+        prefix = _default_prefix(url)
+
+    # Viewports with the same device scale factor share one context and page
+    groups = {}
+    for viewport_name, viewport_config in VIEWPORTS.items():
+        dsf = viewport_config.get('device_scale_factor', 1)
+        groups.setdefault(dsf, []).append((viewport_name, viewport_config))
+
+    # return_exceptions so one group failing to even open a context doesn't
+    # discard the screenshots the other group took
+    group_results = {}
+    outcomes = await asyncio.gather(*[
+        _run_viewport_group(browser, url, output_path, prefix, viewports, verbose, image_format, layout_only)
+        for viewports in groups.values()
+    ], return_exceptions=True)
+    for viewports, outcome in zip(groups.values(), outcomes):
+        if isinstance(outcome, BaseException):
+            if verbose:
+                print(f"  [FAIL] {', '.join(name for name, _ in viewports)} error: {outcome}")
+            outcome = {
+                viewport_name: {
+                    'status': 'error',
+                    'error': str(outcome),
+                    'viewport': f"{viewport_config['width']}x{viewport_config['height']}"
+                }
+                for viewport_name, viewport_config in viewports
+            }
+        group_results.update(outcome)
+    results = {viewport_name: group_results[viewport_name] for viewport_name in VIEWPORTS}
+
+    if verbose:
+        _print_summary(results, output_path)
 
     return results
 
 
+def _print_summary(results: dict, output_path: Path):
+    """Print pass count, JavaScript errors and the screenshot location."""
+    js_errors = [
+        (viewport_name, err)
+        for viewport_name, result in results.items()
+        for err in result.get('js_errors') or ()
+    ]
+
+    print("\n" + "=" * 50)
+    print("RESPONSIVE TEST SUMMARY")
+    print("=" * 50)
+    success_count = sum(1 for r in results.values() if r['status'] == 'success')
+    print(f"Passed: {success_count}/{len(VIEWPORTS)}")
+
+    if js_errors:
+        print(f"\nJavaScript Errors ({len(js_errors)}):")
+        for viewport, error in js_errors:
+            print(f"  [{viewport}] {error[:100]}...")
+
+    print(f"\nScreenshots saved to: {output_path.absolute()}")
+
+
+async def test_responsive_async(url: str, output_dir: str = '.', prefix: str = None, verbose: bool = True,
+                                image_format: str = 'jpeg', layout_only: bool = False):
+    """Launch a browser and test a URL at all three viewport sizes."""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        try:
+            return await run_responsive(browser, url, output_dir, prefix, verbose, image_format, layout_only)
+        finally:
+            await browser.close()
+
+
+def test_responsive(url: str, output_dir: str = '.', prefix: str = None, verbose: bool = True,
+                    image_format: str = 'jpeg', layout_only: bool = False):
+    """
+    Test a URL at all three viewport sizes.
+
+    Args:
+        url: The URL to test
+        output_dir: Directory to save screenshots
+        prefix: Optional prefix for screenshot filenames
+        verbose: Print progress messages
+        image_format: Screenshot format, 'jpeg' or 'png'
+        layout_only: Skip images, fonts and streams for a faster structural check
+
+    Returns:
+        dict with results for each viewport
+    """
+    # Use the warm browser in responsive_daemon.py when it's running
+    try:
+        from responsive_daemon import request_screenshots
+    except ImportError:
+        request_screenshots = None
+
+    if request_screenshots is not None:
+        results = request_screenshots(url, output_dir, prefix, image_format, layout_only)
+        if results is not None:
+            if verbose:
+                print("Using running responsive_daemon browser")
+                _print_summary(results, Path(output_dir))
+            return results
+
+    return asyncio.run(test_responsive_async(url, output_dir, prefix, verbose, image_format, layout_only))
+
+
+async def serve(output_dir: str = '.', verbose: bool = True, image_format: str = 'jpeg',
+                layout_only: bool = False):
+    """
+    Keep one browser running and test URLs read from stdin, one per line.
+
+    Each line is "<url> [prefix]". Skips the Chromium cold start on every run
+    after the first; stops at end of input.
+    """
+    loop = asyncio.get_running_loop()
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        try:
+            if verbose:
+                print("Browser ready - enter URLs to test (Ctrl+D to quit)", flush=True)
+            while True:
+                line = await loop.run_in_executor(None, sys.stdin.readline)
+                if not line:
+                    break
+                fields = line.split()
+                if not fields:
+                    continue
+                url, prefix = fields[0], fields[1] if len(fields) > 1 else None
+                await run_responsive(browser, url, output_dir, prefix, verbose, image_format, layout_only)
+                sys.stdout.flush()
+        finally:
+            await browser.close()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Test responsive design at mobile, tablet, and desktop viewport sizes',
@@ -151,20 +359,37 @@ Examples:
   %(prog)s http://localhost:5000/docs.html
   %(prog)s http://localhost:5000/ --prefix homepage
   %(prog)s https://psfordtaurus.com/docs.html --output-dir ./screenshots
+  %(prog)s --serve --output-dir ./screenshots
         """
     )
-    parser.add_argument('url', help='URL to test')
+    parser.add_argument('url', nargs='?', help='URL to test')
     parser.add_argument('--output-dir', '-o', default='.', help='Directory to save screenshots (default: current)')
     parser.add_argument('--prefix', '-p', help='Prefix for screenshot filenames (auto-generated from URL if not specified)')
     parser.add_argument('--quiet', '-q', action='store_true', help='Suppress progress output')
+    parser.add_argument('--format', '-f', choices=IMAGE_FORMATS, default='jpeg',
+                        help='Screenshot format (default: jpeg; use png for pixel-exact captures)')
+    parser.add_argument('--layout-only', action='store_true',
+                        help='Skip images, web fonts and streams; much faster, for checking layout only')
+    parser.add_argument('--serve', action='store_true',
+                        help='Keep the browser open and test URLs read from stdin ("<url> [prefix]" per line)')
 
     args = parser.parse_args()
 
+    if args.serve:
+        asyncio.run(serve(output_dir=args.output_dir, verbose=not args.quiet,
+                          image_format=args.format, layout_only=args.layout_only))
+        sys.exit(0)
+
+    if not args.url:
+        parser.error('url is required unless --serve is given')
+
     results = test_responsive(
         url=args.url,
         output_dir=args.output_dir,
         prefix=args.prefix,
-        verbose=not args.quiet
+        verbose=not args.quiet,
+        image_format=args.format,
+        layout_only=args.layout_only
     )
 
     # Exit with error code if any tests failed
@@ -13,6 +13,7 @@ Arguments:
     --strict    Fail on any issue (default: fail on medium+ severity)
     --json      Output JSON format instead of text
     --fix       Show suggested fixes for issues
+    --no-cache  Re-scan every file (results for unchanged files are cached in .bandit_cache/)
 
 Examples:
     python helpers/security_scan.py                    # Scan stock_analysis/
@@ -25,14 +26,208 @@ Exit codes:
     2 - Error running scanner
 """
 
+import hashlib
+import io
+import json
+import os
 import subprocess
 import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 
+class _ReportBuffer(io.StringIO):
+    """In-memory report file; Bandit's formatters close their output file when done."""
+    name = "<bandit report>"
+
+    def close(self):
+        pass
+
+
+# Below this many files a worker pool costs more to start than it saves
+PARALLEL_MIN_FILES = 32
+
+
+def _scan_files(files: list) -> tuple:
+    """Scan one chunk of files in a worker process and return its picklable state."""
+    from bandit.core import config as b_config
+    from bandit.core import manager as b_manager
+
+    mgr = b_manager.BanditManager(b_config.BanditConfig(), "file", quiet=True)
+    mgr.files_list = list(files)
+    mgr.run_tests()
+    for issue in mgr.results:
+        issue.fdata = None  # Closed file handle; the report re-reads code by file name
+    per_file_metrics = {k: v for k, v in mgr.metrics.data.items() if k != "_totals"}
+    return mgr.results, mgr.scores, mgr.skipped, mgr.files_list, per_file_metrics
+
+
+def _run_tests_parallel(mgr) -> None:
+    """
+    Run Bandit's tests over mgr.files_list across CPU cores.
+
+    Files are split into contiguous chunks scanned by separate managers; the
+    results are merged back into mgr in file order, so the report matches a
+    serial run.
+    """
+    files = mgr.files_list
+    workers = min(os.cpu_count() or 1, 8)
+    chunk_size = -(-len(files) // (workers * 4))  # Several chunks per worker for balance
+    chunks = [files[i:i + chunk_size] for i in range(0, len(files), chunk_size)]
+
+    mgr.files_list = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for results, scores, skipped, scanned, per_file_metrics in pool.map(_scan_files, chunks):
+            mgr.results.extend(results)
+            mgr.scores.extend(scores)
+            mgr.skipped.extend(skipped)
+            mgr.files_list.extend(scanned)
+            mgr.metrics.data.update(per_file_metrics)
+    mgr.metrics.aggregate()
+
+
+# Per-file results keyed by content hash, so unchanged files aren't re-scanned
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".bandit_cache"
+CACHE_FILE = CACHE_DIR / "results.json"
+
+
+def _file_digest(fname: str) -> str:
+    """Hash a file's contents."""
+    with open(fname, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _load_scan_cache(bandit_version: str) -> dict:
+    """Load cached per-file results; results from another Bandit version are discarded."""
+    try:
+        data = json.loads(CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if data.get("bandit_version") != bandit_version:
+        return {}
+    return data.get("files", {})
+
+
+def _save_scan_cache(bandit_version: str, entries: dict):
+    """Write the cache atomically (best-effort)."""
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        tmp_path = CACHE_FILE.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"bandit_version": bandit_version, "files": entries}))
+        os.replace(tmp_path, CACHE_FILE)
+    except OSError:
+        pass
+
+
+def _merge_cached_results(mgr, all_files: list, digests: dict, cache: dict):
+    """
+    Combine a scan of the changed files with cached results for the rest.
+
+    Adds entries for the freshly scanned files to cache, then rebuilds the
+    manager's files, scores, results and metrics in discovery order.
+    """
+    from bandit.core import issue as b_issue
+    from bandit.core import metrics as b_metrics
+
+    scanned = dict(zip(mgr.files_list, mgr.scores))
+    issues_by_file = {}
+    for issue in mgr.results:
+        issues_by_file.setdefault(issue.fname, []).append(issue)
+
+    for fname, score in scanned.items():
+        if fname in digests:
+            cache[digests[fname]] = {
+                "issues": [issue.as_dict(with_code=False) for issue in issues_by_file.get(fname, ())],
+                "metrics": mgr.metrics.data[fname],
+                "score": score,
+            }
+
+    files_list, scores, results = [], [], []
+    merged_metrics = b_metrics.Metrics()
+    for fname in all_files:
+        if fname in scanned:
+            file_metrics = mgr.metrics.data[fname]
+            issues = issues_by_file.get(fname, [])
+        else:
+            entry = cache.get(digests.get(fname))
+            if entry is None:
+                continue  # Unreadable or unparsable; already in mgr.skipped
+            file_metrics = dict(entry["metrics"])
+            issues = []
+            for data in entry["issues"]:
+                issue = b_issue.issue_from_dict({**data, "filename": fname, "code": None})
+                issues.append(issue)
+        files_list.append(fname)
+        scores.append(scanned[fname] if fname in scanned else cache[digests[fname]]["score"])
+        results.extend(issues)
+        merged_metrics.data[fname] = file_metrics
+
+    merged_metrics.aggregate()
+    mgr.files_list, mgr.scores, mgr.results, mgr.metrics = files_list, scores, results, merged_metrics
+
+
+def run_bandit_in_process(target_path: str, output_format: str = "txt",
+                          severity_level: str = "medium", use_cache: bool = True):
+    """
+    Run Bandit through its Python API, skipping the subprocess startup.
+
+    With use_cache, only files whose contents changed since the last run are
+    scanned; results for the rest come from .bandit_cache/.
+
+    Returns:
+        Tuple of (exit_code, output), or None if Bandit's API isn't available
+    """
+    try:
+        import bandit
+        from bandit.core import config as b_config
+        from bandit.core import constants as b_constants
+        from bandit.core import manager as b_manager
+    except ImportError:
+        return None
+
+    # Same thresholds the CLI uses for -ll (medium+) and no -l (everything)
+    sev_level = "MEDIUM" if severity_level == "medium" else "UNDEFINED"
+    conf_level = "UNDEFINED"
+
+    try:
+        conf = b_config.BanditConfig()
+        # quiet=False like the CLI, so a clean scan still reports "No issues identified"
+        mgr = b_manager.BanditManager(conf, "file", quiet=False)
+        mgr.discover_files([target_path], True, ",".join(b_constants.EXCLUDE))
+
+        all_files = list(mgr.files_list)
+        if use_cache:
+            cache = _load_scan_cache(bandit.__version__)
+            digests = {}
+            for fname in all_files:
+                try:
+                    digests[fname] = _file_digest(fname)
+                except OSError:
+                    pass  # Bandit will report it as skipped
+            mgr.files_list = [f for f in all_files if digests.get(f) not in cache]
+
+        if len(mgr.files_list) >= PARALLEL_MIN_FILES and (os.cpu_count() or 1) > 1:
+            _run_tests_parallel(mgr)
+        else:
+            mgr.run_tests()
+
+        if use_cache:
+            _merge_cached_results(mgr, all_files, digests, cache)
+            _save_scan_cache(bandit.__version__, cache)
+
+        report = _ReportBuffer()
+        mgr.output_results(3, sev_level, conf_level, report, output_format)
+    except (AttributeError, TypeError):
+        return None  # API differs in this Bandit version; use the CLI instead
+
+    exit_code = 1 if mgr.results_count(sev_filter=sev_level, conf_filter=conf_level) > 0 else 0
+    return exit_code, report.getvalue()
+
+
 def run_bandit(target_path: str, output_format: str = "txt",
-               severity_level: str = "medium") -> tuple[int, str]:
+               severity_level: str = "medium", stream: bool = False,
+               use_cache: bool = True) -> tuple[int, str]:
     """
     Run Bandit security scanner.
 
@@ -40,10 +235,21 @@ def run_bandit(target_path: str, output_format: str = "txt",
         target_path: Directory or file to scan
         output_format: Output format (txt, json, csv, html)
         severity_level: Minimum severity to report (low, medium, high)
+        stream: Also write the output to stdout. Only the subprocess fallback
+            (Bandit's API not importable) echoes it line by line as the scan
+            runs; the in-process path prints the finished report at once,
+            since Bandit's formatters render it in a single write.
+        use_cache: Reuse cached results for files unchanged since the last scan
 
     Returns:
         Tuple of (exit_code, output)
     """
+    result = run_bandit_in_process(target_path, output_format, severity_level, use_cache)
+    if result is not None:
+        if stream:
+            sys.stdout.write(result[1])
+        return result
+
     cmd = [
         sys.executable, "-m", "bandit",
         "-r", target_path,
@@ -55,12 +261,22 @@ def run_bandit(target_path: str, output_format: str = "txt",
     cmd = [c for c in cmd if c]
 
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True
-        )
-        return result.returncode, result.stdout + result.stderr
+        if not stream:
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True
+            )
+            return result.returncode, result.stdout + result.stderr
+
+        # Show findings as they arrive instead of after the whole scan
+        lines = []
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, bufsize=1) as proc:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+                lines.append(line)
+        return proc.returncode, "".join(lines)
     except FileNotFoundError:
         return 2, "Error: Bandit not installed. Run: pip install bandit"
 
@@ -92,6 +308,11 @@ def main():
         action="store_true",
         help="Only show issues, no banner"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-scan every file instead of reusing results for unchanged files"
+    )
 
     args = parser.parse_args()
 
@@ -113,10 +334,14 @@ def main():
         print(f"Mode: {'Strict (all issues)' if args.strict else 'Standard (medium+ severity)'}")
         print("-" * 60)
 
-    # Run scan
-    exit_code, output = run_bandit(str(target), output_format, severity)
+    # Let run_bandit print text reports itself (line by line when it falls back
+    # to the CLI); JSON is printed here once complete
+    stream = not args.json
+    exit_code, output = run_bandit(str(target), output_format, severity, stream=stream,
+                                   use_cache=not args.no_cache)
 
-    print(output)
+    if not stream:
+        print(output)
 
     if not args.quiet and not args.json:
         print("-" * 60)
@@ -11,7 +11,8 @@ Usage:
     python helpers/slack_acknowledger.py --status  # Show pending acknowledgments
 
 The acknowledger tracks which messages have been acknowledged via a separate
-file (slack_acknowledged.json) to avoid duplicate reactions.
+append-only file (slack_acknowledged.txt, one timestamp per line) to avoid
+duplicate reactions.
 
 Environment:
     SLACK_BOT_TOKEN   Bot OAuth token (xoxb-...)
@@ -22,72 +23,168 @@ import json
 import sys
 import os
 import argparse
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
 from dotenv import load_dotenv
-env_path = Path(__file__).parent.parent / '.env'
-load_dotenv(env_path)
+
+# Paths
+PROJECT_ROOT = Path(__file__).parent.parent
+load_dotenv(PROJECT_ROOT / '.env')
 
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 
-# Paths
-PROJECT_ROOT = Path(__file__).parent.parent
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None  # Fall back to polling every --interval seconds
+
+try:
+    from orjson import loads as json_loads  # Faster parsing of large inbox files
+except ImportError:
+    from json import loads as json_loads
+
 INBOX_FILE = PROJECT_ROOT / "slack_inbox.json"
-ACK_FILE = PROJECT_ROOT / "slack_acknowledged.json"
+INBOX_FILE_STR = os.fspath(INBOX_FILE)  # Checked on every wakeup; skip Path conversion
+ACK_FILE = PROJECT_ROOT / "slack_acknowledged.txt"
+LEGACY_ACK_FILE = PROJECT_ROOT / "slack_acknowledged.json"  # Migrated on first load
 LOG_FILE = PROJECT_ROOT / "slack_acknowledger.log"
 
 # Default channel
 DEFAULT_CHANNEL_ID = os.getenv("SLACK_CHANNEL_ID", "C0A8LB49E1M")
 
+# Concurrent reactions.add calls when several messages are pending
+ACK_WORKERS = 6
+
+# With file notifications, still re-check this often in case an event is missed
+WATCH_SAFETY_INTERVAL = 60
+
+
+# Log file handle, opened on first use and kept for the life of the process
+_log_handle = None
+_log_lock = threading.Lock()  # Reactions are logged from worker threads
+
 
 def log(message: str, also_print: bool = True):
     """Write to log file and optionally print."""
+    global _log_handle
+
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     log_line = f"[{timestamp}] {message}"
 
     if also_print:
         print(log_line, flush=True)
 
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(log_line + "\n")
+    with _log_lock:
+        if _log_handle is None:
+            # Line-buffered so every entry still reaches the file immediately
+            _log_handle = open(LOG_FILE, "a", encoding="utf-8", buffering=1)
+        _log_handle.write(log_line + "\n")
+
+
+# Parsed file contents keyed by (mtime_ns, size), so polling an unchanged
+# file costs a stat() instead of a full JSON parse
+_INBOX_CACHE = {"key": None, "data": []}
+_ACK_CACHE = {"key": None, "data": set()}
+
+# Rewrite the acknowledged file once it holds this many times more lines than
+# unique timestamps (duplicates only come from overlapping runs)
+ACK_COMPACT_RATIO = 2
+
+
+def _file_key(path):
+    """Return (mtime_ns, size) identifying the file's current contents, or None if missing."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
 
 
 def load_inbox() -> list:
     """Load inbox messages."""
-    if INBOX_FILE.exists():
-        try:
-            with open(INBOX_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            return []
-    return []
+    key = _file_key(INBOX_FILE_STR)
+    if key is None:
+        return []
+    if key == _INBOX_CACHE["key"]:
+        return _INBOX_CACHE["data"]
+
+    try:
+        with open(INBOX_FILE_STR, "rb") as f:
+            data = json_loads(f.read())
+    except json.JSONDecodeError:
+        return []  # Possibly mid-write; don't cache so the next poll retries
+
+    _INBOX_CACHE["key"], _INBOX_CACHE["data"] = key, data
+    return data
+
+
+def _write_acknowledged(timestamps: set):
+    """Rewrite the acknowledged file with exactly one line per timestamp."""
+    tmp_path = ACK_FILE.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.writelines(ts + "\n" for ts in sorted(timestamps))
+    os.replace(tmp_path, ACK_FILE)
+
+
+def _migrate_legacy_acknowledged():
+    """Convert the old slack_acknowledged.json into the line-based file."""
+    try:
+        with open(LEGACY_ACK_FILE, "rb") as f:
+            timestamps = set(json_loads(f.read()).get("acknowledged", []))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return
+    _write_acknowledged(timestamps)
+    LEGACY_ACK_FILE.unlink()
 
 
 def load_acknowledged() -> set:
     """Load set of already-acknowledged message timestamps."""
-    if ACK_FILE.exists():
-        try:
-            with open(ACK_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return set(data.get("acknowledged", []))
-        except json.JSONDecodeError:
+    key = _file_key(ACK_FILE)
+    if key is None:
+        if not LEGACY_ACK_FILE.exists():
+            return set()
+        _migrate_legacy_acknowledged()
+        key = _file_key(ACK_FILE)
+        if key is None:
             return set()
-    return set()
 
+    if key != _ACK_CACHE["key"]:
+        with open(ACK_FILE, "r", encoding="utf-8") as f:
+            lines = [line.rstrip("\n") for line in f]
+        timestamps = {ts for ts in lines if ts}
 
-def save_acknowledged(timestamps: set):
-    """Save the set of acknowledged timestamps."""
-    with open(ACK_FILE, "w", encoding="utf-8") as f:
-        json.dump({"acknowledged": list(timestamps), "updated_at": datetime.now().isoformat()}, f, indent=2)
+        if len(lines) > ACK_COMPACT_RATIO * max(len(timestamps), 1):
+            _write_acknowledged(timestamps)
+            key = _file_key(ACK_FILE)
 
+        _ACK_CACHE["key"], _ACK_CACHE["data"] = key, timestamps
+
+    # Callers add to the set they get back; keep the cached one untouched
+    return set(_ACK_CACHE["data"])
 
-def get_pending_acknowledgments() -> list:
-    """Get messages that are read but not yet acknowledged in Slack."""
-    inbox = load_inbox()
-    acknowledged = load_acknowledged()
+
+def append_acknowledged(timestamps):
+    """Record newly acknowledged timestamps by appending them to the file."""
+    with open(ACK_FILE, "a", encoding="utf-8") as f:
+        f.writelines(ts + "\n" for ts in timestamps)
+
+
+def get_pending_acknowledgments(inbox: list = None, acknowledged: set = None) -> list:
+    """
+    Get messages that are read but not yet acknowledged in Slack.
+
+    Callers that already loaded the inbox or acknowledged set can pass them in
+    to avoid reading the files again.
+    """
+    if inbox is None:
+        inbox = load_inbox()
+    if acknowledged is None:
+        acknowledged = load_acknowledged()
 
     pending = []
     for msg in inbox:
@@ -131,38 +228,75 @@ def acknowledge_message(client: WebClient, channel_id: str, timestamp: str) -> b
         return False
 
 
-def process_acknowledgments(client: WebClient, channel_id: str) -> int:
-    """Process all pending acknowledgments. Returns count of newly acknowledged."""
-    pending = get_pending_acknowledgments()
+def resolve_channel(msg: dict, channel_id: str) -> str:
+    """Get the channel ID a message was posted in, falling back to the default."""
+    msg_channel = msg.get("channel", "")
+    # Channel might be stored as "#C0A8LB49E1M" format
+    if msg_channel.startswith("#"):
+        msg_channel = msg_channel[1:]
+    if not msg_channel or not msg_channel.startswith("C"):
+        msg_channel = channel_id
+    return msg_channel
+
+
+def process_acknowledgments(client: WebClient, channel_id: str, acknowledged: set = None) -> int:
+    """
+    Process all pending acknowledgments. Returns count of newly acknowledged.
+
+    A long-running caller can pass its own acknowledged set; it is used instead
+    of re-reading the file and is updated in place.
+    """
+    pending = [msg for msg in get_pending_acknowledgments(acknowledged=acknowledged) if msg.get("timestamp")]
 
     if not pending:
         return 0
 
-    acknowledged = load_acknowledged()
-    new_count = 0
+    newly_acknowledged = []
 
-    for msg in pending:
-        ts = msg.get("timestamp")
-        if not ts:
-            continue
+    # Each reaction is an independent HTTP round-trip; send a few at once
+    # (well inside Slack's reactions.add rate limit)
+    with ThreadPoolExecutor(max_workers=min(ACK_WORKERS, len(pending))) as executor:
+        futures = {
+            executor.submit(acknowledge_message, client, resolve_channel(msg, channel_id), msg["timestamp"]): msg
+            for msg in pending
+        }
+        for future in as_completed(futures):
+            msg = futures[future]
+            if future.result():
+                newly_acknowledged.append(msg["timestamp"])
+                log(f"Acknowledged message {msg.get('id')}: {msg.get('text', '')[:40]}...")
+
+    if newly_acknowledged:
+        append_acknowledged(newly_acknowledged)
+        if acknowledged is not None:
+            acknowledged.update(newly_acknowledged)
+
+    return len(newly_acknowledged)
 
-        # Extract channel ID from the message or use default
-        msg_channel = msg.get("channel", "")
-        # Channel might be stored as "#C0A8LB49E1M" format
-        if msg_channel.startswith("#"):
-            msg_channel = msg_channel[1:]
-        if not msg_channel or not msg_channel.startswith("C"):
-            msg_channel = channel_id
 
-        if acknowledge_message(client, msg_channel, ts):
-            acknowledged.add(ts)
-            new_count += 1
-            log(f"Acknowledged message {msg.get('id')}: {msg.get('text', '')[:40]}...")
+def start_inbox_watcher(inbox_changed: threading.Event):
+    """
+    Set inbox_changed whenever slack_inbox.json is written.
 
-    if new_count > 0:
-        save_acknowledged(acknowledged)
+    Returns the running watchdog Observer, or None if watchdog isn't installed.
+    """
+    if Observer is None:
+        return None
 
-    return new_count
+    inbox_name = INBOX_FILE.name
+
+    class InboxHandler(FileSystemEventHandler):
+        def on_any_event(self, event):
+            # Covers in-place writes as well as write-then-rename saves
+            paths = (event.src_path, getattr(event, "dest_path", ""))
+            if any(os.path.basename(p) == inbox_name for p in paths):
+                inbox_changed.set()
+
+    observer = Observer()
+    observer.schedule(InboxHandler(), str(INBOX_FILE.parent), recursive=False)
+    observer.daemon = True
+    observer.start()
+    return observer
 
 
 def run_continuous(interval: int = 5, channel_id: str = None):
@@ -176,15 +310,26 @@ def run_continuous(interval: int = 5, channel_id: str = None):
 
     client = WebClient(token=bot_token)
 
-    log(f"Starting acknowledger (checking every {interval}s)")
+    # Sleep until the inbox changes rather than waking every few seconds
+    inbox_changed = threading.Event()
+    observer = start_inbox_watcher(inbox_changed)
+    wait_timeout = WATCH_SAFETY_INTERVAL if observer else interval
+
+    if observer:
+        log(f"Starting acknowledger (watching {INBOX_FILE.name} for changes)")
+    else:
+        log(f"Starting acknowledger (checking every {interval}s)")
     log("Press Ctrl+C to stop")
     log("-" * 40)
 
     last_status = datetime.now()
 
+    # This process is the only writer, so read the acknowledged file once
+    acknowledged = load_acknowledged()
+
     try:
         while True:
-            new_count = process_acknowledgments(client, channel_id)
+            new_count = process_acknowledgments(client, channel_id, acknowledged)
 
             # Print status every minute if no activity
             now = datetime.now()
@@ -192,18 +337,23 @@ def run_continuous(interval: int = 5, channel_id: str = None):
                 print(f"[{now.strftime('%H:%M:%S')}] Watching for read messages...", flush=True)
                 last_status = now
 
-            time.sleep(interval)
+            inbox_changed.wait(wait_timeout)
+            inbox_changed.clear()
 
     except KeyboardInterrupt:
         log("\nAcknowledger stopped by user.")
         return 0
 
+    finally:
+        if observer:
+            observer.stop()
+
 
 def show_status():
     """Display acknowledgment status."""
     inbox = load_inbox()
     acknowledged = load_acknowledged()
-    pending = get_pending_acknowledgments()
+    pending = get_pending_acknowledgments(inbox, acknowledged)
 
     read_count = sum(1 for m in inbox if m.get("read", False))
 
@@ -243,7 +393,7 @@ def main():
         "--interval", "-i",
         type=int,
         default=5,
-        help="Check interval in seconds (default: 5)"
+        help="Check interval in seconds when watchdog isn't installed (default: 5)"
     )
     parser.add_argument(
         "--channel",
@@ -25,6 +25,11 @@ import time
 from pathlib import Path
 from datetime import datetime
 
+try:
+    from orjson import loads as json_loads  # Faster parsing of large inbox files
+except ImportError:
+    from json import loads as json_loads
+
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent
 HELPERS_DIR = PROJECT_ROOT / "helpers"
@@ -40,8 +45,8 @@ def load_pids() -> dict:
     """Load saved PIDs."""
     if PID_FILE.exists():
         try:
-            with open(PID_FILE, "r") as f:
-                return json.load(f)
+            with open(PID_FILE, "rb") as f:
+                return json_loads(f.read())
         except Exception:
             pass
     return {}
@@ -54,24 +59,66 @@ def save_pids(pids: dict):
         json.dump(pids, f, indent=2)
 
 
+if sys.platform == "win32":
+    import ctypes
+    from ctypes import wintypes
+
+    KERNEL32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    # Declared so 64-bit HANDLEs aren't truncated to the default C int
+    KERNEL32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    KERNEL32.OpenProcess.restype = wintypes.HANDLE
+    KERNEL32.GetExitCodeProcess.argtypes = (wintypes.HANDLE, ctypes.POINTER(wintypes.DWORD))
+    KERNEL32.GetExitCodeProcess.restype = wintypes.BOOL
+    KERNEL32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    KERNEL32.CloseHandle.restype = wintypes.BOOL
+    KERNEL32.TerminateProcess.argtypes = (wintypes.HANDLE, wintypes.UINT)
+    KERNEL32.TerminateProcess.restype = wintypes.BOOL
+    PROCESS_TERMINATE = 0x0001
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    STILL_ACTIVE = 259
+    ERROR_ACCESS_DENIED = 5
+
+
+def _win_process_running(pid: int) -> bool:
+    """Check a PID with OpenProcess/GetExitCodeProcess instead of spawning tasklist."""
+    handle = KERNEL32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        # Access denied means the process exists but belongs to someone else
+        return ctypes.get_last_error() == ERROR_ACCESS_DENIED
+    try:
+        exit_code = wintypes.DWORD()
+        if not KERNEL32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+            return False
+        return exit_code.value == STILL_ACTIVE
+    finally:
+        KERNEL32.CloseHandle(handle)
+
+
+def _win_terminate_process(pid: int):
+    """Kill a process with TerminateProcess instead of spawning taskkill."""
+    handle = KERNEL32.OpenProcess(PROCESS_TERMINATE, False, pid)
+    if not handle:
+        # Includes ERROR_ACCESS_DENIED for another user's process
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        if not KERNEL32.TerminateProcess(handle, 1):
+            raise ctypes.WinError(ctypes.get_last_error())
+    finally:
+        KERNEL32.CloseHandle(handle)
+
+
 def is_process_running(pid: int) -> bool:
     """Check if a process with given PID is running."""
     if pid is None:
         return False
     try:
         if sys.platform == "win32":
-            # Windows: use tasklist
-            result = subprocess.run(
-                ["tasklist", "/FI", f"PID eq {pid}", "/NH"],
-                capture_output=True,
-                text=True
-            )
-            return str(pid) in result.stdout
+            return _win_process_running(pid)
         else:
             # Unix: send signal 0 to check
             os.kill(pid, 0)
             return True
-    except (OSError, subprocess.SubprocessError):
+    except OSError:
         return False
 
 
@@ -110,12 +157,7 @@ def stop_service(name: str, pid: int) -> bool:
 
     try:
         if sys.platform == "win32":
-            # Windows: use taskkill
-            subprocess.run(
-                ["taskkill", "/F", "/PID", str(pid)],
-                capture_output=True,
-                check=True
-            )
+            _win_terminate_process(pid)
         else:
             # Unix: send SIGTERM
             os.kill(pid, signal.SIGTERM)
@@ -198,8 +240,8 @@ def show_status():
     inbox_file = PROJECT_ROOT / "slack_inbox.json"
     if inbox_file.exists():
         try:
-            with open(inbox_file, "r") as f:
-                inbox = json.load(f)
+            with open(inbox_file, "rb") as f:
+                inbox = json_loads(f.read())
             unread = sum(1 for m in inbox if not m.get("read", False))
             print(f"Inbox: {len(inbox)} messages ({unread} unread)")
         except Exception:
@@ -22,11 +22,26 @@ import os
 import sys
 import json
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 
 from dotenv import load_dotenv
 
+try:
+    # Faster (de)serialization of large inbox files
+    from orjson import OPT_INDENT_2, dumps as _orjson_dumps, loads as json_loads
+
+    def json_dumps_pretty(obj) -> bytes:
+        """Serialize to indented UTF-8 JSON."""
+        return _orjson_dumps(obj, option=OPT_INDENT_2)
+except ImportError:
+    from json import loads as json_loads
+
+    def json_dumps_pretty(obj) -> bytes:
+        """Serialize to indented UTF-8 JSON."""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 # Load environment
 env_path = Path(__file__).parent.parent / '.env'
 load_dotenv(env_path)
@@ -38,6 +53,35 @@ DOWNLOADS_DIR = PROJECT_ROOT / "slack_downloads"
 # Maximum file size to download (10MB default)
 MAX_FILE_SIZE_MB = 10
 
+# Read size when streaming a download to disk, and the write buffer that
+# batches several chunks into one write call
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+DOWNLOAD_WRITE_BUFFER = 1024 * 1024
+
+# Concurrent downloads when several files are pending
+DOWNLOAD_WORKERS = 8
+
+# Transient failures (rate limiting, server errors) are retried with backoff
+DOWNLOAD_RETRIES = 3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class _SafeNameTable(dict):
+    """
+    str.translate table keeping alphanumerics and .-_ and mapping anything else to _.
+
+    Entries are filled in on first sight of each character, so non-ASCII
+    letters are kept exactly as str.isalnum() would decide.
+    """
+
+    def __missing__(self, codepoint):
+        c = chr(codepoint)
+        self[codepoint] = codepoint if c.isalnum() or c in ".-_" else ord("_")
+        return self[codepoint]
+
+
+_SAFE_NAME_TABLE = _SafeNameTable()
+
 
 def log(message: str):
     """Print timestamped log message."""
@@ -49,22 +93,46 @@ def load_inbox() -> list:
     """Load inbox messages."""
     if INBOX_FILE.exists():
         try:
-            with open(INBOX_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(INBOX_FILE, "rb") as f:
+                return json_loads(f.read())
         except json.JSONDecodeError:
             return []
     return []
 
 
+def build_file_index(inbox: list) -> dict:
+    """
+    Map each Slack file ID to its (message_index, file_index) positions in the inbox.
+
+    A file shared in several messages appears once per message, so each ID
+    maps to a list of positions.
+    """
+    index = {}
+    for mi, msg in enumerate(inbox):
+        for fi, f in enumerate(msg.get("files", [])):
+            index.setdefault(f.get("id"), []).append((mi, fi))
+    return index
+
+
 def get_pending_files() -> list:
-    """Get all files from inbox that haven't been downloaded yet."""
+    """
+    Get all files from inbox that haven't been downloaded yet.
+
+    A file shared in several messages is returned once (for its first
+    message); marking it downloaded updates every message that references it.
+    """
     inbox = load_inbox()
     pending = []
+    seen_ids = set()
 
     for msg in inbox:
         files = msg.get("files", [])
         for f in files:
+            file_id = f.get("id")
+            if file_id and file_id in seen_ids:
+                continue
             if not f.get("downloaded"):
+                seen_ids.add(file_id)
                 pending.append({
                     "file": f,
                     "message_id": msg.get("id"),
@@ -113,13 +181,33 @@ def list_files():
     print()
 
 
-def download_file(file_info: dict, token: str) -> tuple[bool, str]:
+def create_session(token: str):
+    """
+    Create an authenticated requests session for Slack file downloads.
+
+    Sharing one session keeps the TLS connection to files.slack.com open
+    between files instead of reconnecting for each download.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers["Authorization"] = f"Bearer {token}"
+    retry = Retry(total=DOWNLOAD_RETRIES, backoff_factor=0.5, status_forcelist=RETRY_STATUSES,
+                  raise_on_status=False)  # Report the final HTTP status as before
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=DOWNLOAD_WORKERS, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+def download_file(file_info: dict, session) -> tuple[bool, str]:
     """
     Download a single file from Slack.
 
     Args:
         file_info: File metadata dict from inbox
-        token: Slack bot token
+        session: Authenticated session from create_session
 
     Returns:
         Tuple of (success: bool, message: str)
@@ -142,35 +230,38 @@ def download_file(file_info: dict, token: str) -> tuple[bool, str]:
     # Create downloads directory
     DOWNLOADS_DIR.mkdir(exist_ok=True)
 
-    # Generate unique filename
+    # Generate unique filename; the file ID keeps same-named files downloaded
+    # in the same second (e.g. several "image.png" uploads) apart
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_name = "".join(c if c.isalnum() or c in ".-_" else "_" for c in file_name)
-    local_path = DOWNLOADS_DIR / f"{timestamp}_{safe_name}"
+    safe_name = file_name.translate(_SAFE_NAME_TABLE)
+    safe_id = str(file_id).translate(_SAFE_NAME_TABLE)
+    local_path = DOWNLOADS_DIR / f"{timestamp}_{safe_id}_{safe_name}"
 
     # Download file
-    headers = {"Authorization": f"Bearer {token}"}
-
     try:
-        response = requests.get(url, headers=headers, allow_redirects=True, timeout=30)
-
-        if response.status_code != 200:
-            return False, f"HTTP {response.status_code}"
-
-        # Check content type
-        content_type = response.headers.get("content-type", "")
-        if "text/html" in content_type:
-            return False, "Got HTML instead of file - bot may need 'files:read' scope"
-
-        # Save file
-        with open(local_path, "wb") as f:
-            f.write(response.content)
+        # Stream straight to disk so large files never sit in memory
+        with session.get(url, allow_redirects=True, stream=True, timeout=30) as response:
+            if response.status_code != 200:
+                return False, f"HTTP {response.status_code}"
+
+            # Check content type
+            content_type = response.headers.get("content-type", "")
+            if "text/html" in content_type:
+                return False, "Got HTML instead of file - bot may need 'files:read' scope"
+
+            # Save file
+            bytes_written = 0
+            with open(local_path, "wb", buffering=DOWNLOAD_WRITE_BUFFER) as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    bytes_written += len(chunk)
 
         # Write metadata file
         metadata = {
             "original_name": file_name,
             "file_id": file_id,
             "mimetype": file_info.get("mimetype"),
-            "size": len(response.content),
+            "size": bytes_written,
             "downloaded_at": datetime.now().isoformat(),
             "slack_url": url
         }
@@ -182,29 +273,51 @@ def download_file(file_info: dict, token: str) -> tuple[bool, str]:
             }
 
         meta_path = str(local_path) + ".meta.json"
-        with open(meta_path, "w") as f:
-            json.dump(metadata, f, indent=2)
+        with open(meta_path, "wb") as f:
+            f.write(json_dumps_pretty(metadata))
 
         return True, str(local_path)
 
     except requests.RequestException as e:
+        local_path.unlink(missing_ok=True)  # Don't leave a truncated file behind
         return False, f"Download failed: {e}"
 
 
-def update_inbox_file_status(file_id: str, local_path: str):
-    """Mark a file as downloaded in the inbox."""
+def update_inbox_file_status(downloaded: dict):
+    """
+    Mark files as downloaded in the inbox.
+
+    Args:
+        downloaded: Mapping of Slack file ID to local path
+    """
+    if not downloaded:
+        return
+
+    # Re-read just before writing so messages the listener added meanwhile are kept
     inbox = load_inbox()
+    index = build_file_index(inbox)
+    downloaded_at = datetime.now().isoformat()
 
-    for msg in inbox:
-        files = msg.get("files", [])
-        for f in files:
-            if f.get("id") == file_id:
-                f["downloaded"] = True
-                f["local_path"] = local_path
-                f["downloaded_at"] = datetime.now().isoformat()
+    for file_id, local_path in downloaded.items():
+        for mi, fi in index.get(file_id, []):
+            f = inbox[mi]["files"][fi]
+            f["downloaded"] = True
+            f["local_path"] = local_path
+            f["downloaded_at"] = downloaded_at
+
+    # Swap in a complete file so the listener never reads a partial inbox
+    tmp_path = INBOX_FILE.with_suffix(".tmp")
+    with open(tmp_path, "wb") as out:
+        out.write(json_dumps_pretty(inbox))
+    os.replace(tmp_path, INBOX_FILE)
 
-    with open(INBOX_FILE, "w", encoding="utf-8") as out:
-        json.dump(inbox, out, indent=2, ensure_ascii=False)
+
+def _download_one(item: dict, session) -> tuple[bool, str, str]:
+    """Download one pending file; returns (success, result, file_id)."""
+    f = item["file"]
+    log(f"Downloading: {f.get('name', 'unknown')}")
+    success, result = download_file(f, session)
+    return success, result, f.get("id")
 
 
 def download_all_pending():
@@ -222,20 +335,25 @@ def download_all_pending():
 
     print(f"Found {len(pending)} file(s) to download.\n")
 
+    # Downloads are network-bound, so overlap them; the inbox is updated once
+    # at the end (or on Ctrl+C) rather than rewritten per file
+    downloaded = {}
     success_count = 0
-    for item in pending:
-        f = item["file"]
-        file_name = f.get("name", "unknown")
-        log(f"Downloading: {file_name}")
-
-        success, result = download_file(f, token)
-
-        if success:
-            log(f"  Saved to: {result}")
-            update_inbox_file_status(f.get("id"), result)
-            success_count += 1
-        else:
-            log(f"  FAILED: {result}")
+    try:
+        with create_session(token) as session, \
+                ThreadPoolExecutor(max_workers=min(DOWNLOAD_WORKERS, len(pending))) as pool:
+            futures = [pool.submit(_download_one, item, session) for item in pending]
+            for future in as_completed(futures):
+                success, result, file_id = future.result()
+
+                if success:
+                    log(f"  Saved to: {result}")
+                    downloaded[file_id] = result
+                    success_count += 1
+                else:
+                    log(f"  FAILED ({file_id}): {result}")
+    finally:
+        update_inbox_file_status(downloaded)
 
     print(f"\nDownloaded {success_count}/{len(pending)} files.")
     return 0 if success_count == len(pending) else 1
@@ -250,27 +368,22 @@ def download_by_id(file_id: str):
 
     # Find file in inbox
     inbox = load_inbox()
-    target_file = None
-
-    for msg in inbox:
-        files = msg.get("files", [])
-        for f in files:
-            if f.get("id") == file_id:
-                target_file = f
-                break
-        if target_file:
-            break
+    positions = build_file_index(inbox).get(file_id)
 
-    if not target_file:
+    if not positions:
         print(f"File ID '{file_id}' not found in inbox.")
         return 1
 
+    mi, fi = positions[0]
+    target_file = inbox[mi]["files"][fi]
+
     log(f"Downloading: {target_file.get('name', 'unknown')}")
-    success, result = download_file(target_file, token)
+    with create_session(token) as session:
+        success, result = download_file(target_file, session)
 
     if success:
         log(f"Saved to: {result}")
-        update_inbox_file_status(file_id, result)
+        update_inbox_file_status({file_id: result})
         return 0
     else:
         log(f"FAILED: {result}")
@@ -288,8 +401,8 @@ def show_file_info(file_path: str):
     # Check for metadata file
     meta_path = Path(str(path) + ".meta.json")
     if meta_path.exists():
-        with open(meta_path) as f:
-            metadata = json.load(f)
+        with open(meta_path, "rb") as f:
+            metadata = json_loads(f.read())
         print("\nFile Metadata:")
         print(json.dumps(metadata, indent=2))
     else:
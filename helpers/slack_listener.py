@@ -8,6 +8,7 @@ Run this as a background process to enable two-way Claude-user communication.
 Usage:
     python helpers/slack_listener.py --poll       # Poll every 10 seconds (recommended)
     python helpers/slack_listener.py --poll -i 5  # Poll every 5 seconds
+    python helpers/slack_listener.py --poll --no-react  # Poll without :eyes: reactions
     python helpers/slack_listener.py              # Socket Mode (requires app token)
     python helpers/slack_listener.py --check      # Check inbox without starting listener
     python helpers/slack_listener.py --sync       # Fetch missed messages from channel history
@@ -24,6 +25,11 @@ import json
 import sys
 import os
 import argparse
+import atexit
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -32,23 +38,74 @@ from dotenv import load_dotenv
 env_path = Path(__file__).parent.parent / '.env'
 load_dotenv(env_path)
 
-from slack_bolt import App
-from slack_bolt.adapter.socket_mode import SocketModeHandler
+# slack_bolt is imported only where Socket Mode needs it, so --check, --clear
+# and --mark-read start quickly
 import logging
 
 # Set logging level (DEBUG for troubleshooting, WARNING for normal use)
 logging.basicConfig(level=logging.WARNING)
 slack_logger = logging.getLogger("slack_bolt")
 
+try:
+    # Faster (de)serialization of large inbox files
+    from orjson import OPT_INDENT_2, dumps as _orjson_dumps, loads as json_loads
+
+    def json_dumps_pretty(obj) -> bytes:
+        """Serialize to indented UTF-8 JSON."""
+        return _orjson_dumps(obj, option=OPT_INDENT_2)
+except ImportError:
+    from json import loads as json_loads
+
+    def json_dumps_pretty(obj) -> bytes:
+        """Serialize to indented UTF-8 JSON."""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
 # Paths
 PROJECT_ROOT = Path(__file__).parent.parent
 INBOX_FILE = PROJECT_ROOT / "slack_inbox.json"
 LOG_FILE = PROJECT_ROOT / "slack_listener.log"
 LAST_SYNC_FILE = PROJECT_ROOT / "slack_last_sync.txt"
+USER_CACHE_FILE = PROJECT_ROOT / ".slack_user_cache.json"
+UNREAD_FILE = PROJECT_ROOT / "slack_inbox_unread.json"
 
 # Default channel for syncing (claude-notifications)
 DEFAULT_CHANNEL_ID = os.getenv("SLACK_CHANNEL_ID", "C0A8LB49E1M")
 
+# How long resolved display names are reused before asking Slack again
+USER_CACHE_TTL = 600
+CHANNEL_CACHE_TTL = 3600
+
+# id -> (name, expires_at); saves a users.info/conversations.info call per message
+_USER_CACHE = {}
+_CHANNEL_CACHE = {}
+
+# Page size for users.list when preloading the workspace directory
+USER_DIRECTORY_PAGE_SIZE = 1000
+
+# When the whole directory was last loaded into _USER_CACHE
+_user_directory_loaded_at = 0.0
+
+# The user cache is persisted so a restart doesn't re-resolve every sender;
+# new entries are flushed at most this often (seconds) and on exit
+USER_CACHE_SAVE_INTERVAL = 60
+_user_cache_state = {"loaded": False, "dirty": False, "saved_at": 0.0}
+_user_cache_lock = threading.Lock()  # Names are resolved from worker threads
+
+# Poll mode only reacts to messages newer than this (seconds), or two poll
+# intervals if longer; older ones were sent while the listener was down and
+# the sender has long moved on
+REACTION_MAX_AGE = 120
+
+# Poll mode backs off exponentially while the channel is idle, up to this
+# many seconds between polls; any new message resets it to --interval
+POLL_MAX_IDLE_INTERVAL = 60
+
+# Most history pages sync_history walks back through to find missed messages
+SYNC_MAX_PAGES = 10
+
+# Concurrent Slack calls (thread replies, user lookups) during a history sync
+SYNC_WORKERS = 4
+
 
 def log(message: str):
     """Write to log file and print."""
@@ -60,26 +117,110 @@ def log(message: str):
         f.write(log_line + "\n")
 
 
+# Parsed inbox keyed by (mtime_ns, size) of the file we last read or wrote, so
+# adding a message doesn't re-parse the whole inbox unless someone else
+# (e.g. the agent marking messages read) changed it in between
+_INBOX_CACHE = {"key": None, "data": []}
+
+# Timestamps of the messages in the cached inbox, kept up to date by
+# add_message so sync doesn't rebuild the set from the whole inbox
+_KNOWN_TS = {"key": None, "data": set()}
+
+# Socket Mode handlers run on worker threads; serialize inbox updates
+_inbox_lock = threading.Lock()
+
+
+def _file_key(path):
+    """Return (mtime_ns, size) identifying the file's current contents, or None if missing."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def load_inbox() -> list:
     """Load existing inbox messages."""
-    if INBOX_FILE.exists():
-        try:
-            with open(INBOX_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            return []
-    return []
+    key = _file_key(INBOX_FILE)
+    if key is None:
+        _INBOX_CACHE["key"], _INBOX_CACHE["data"] = None, []
+        return _INBOX_CACHE["data"]
+    if key == _INBOX_CACHE["key"]:
+        return _INBOX_CACHE["data"]
+
+    try:
+        with open(INBOX_FILE, "rb") as f:
+            data = json_loads(f.read())
+    except json.JSONDecodeError:
+        return []
+
+    _INBOX_CACHE["key"], _INBOX_CACHE["data"] = key, data
+    return data
 
 
 def save_inbox(messages: list):
     """Save messages to inbox file."""
-    with open(INBOX_FILE, "w", encoding="utf-8") as f:
-        json.dump(messages, f, indent=2, ensure_ascii=False)
+    # Write to a temp file and swap it in so readers never see a partial inbox
+    tmp_path = INBOX_FILE.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(json_dumps_pretty(messages))
+    os.replace(tmp_path, INBOX_FILE)
+
+    _INBOX_CACHE["key"], _INBOX_CACHE["data"] = _file_key(INBOX_FILE), messages
+    _save_unread_summary(_INBOX_CACHE["key"], messages)
+
+
+def _save_unread_summary(key, messages: list) -> dict:
+    """Record message counts for the inbox state identified by key (best-effort)."""
+    summary = {
+        "inbox_key": list(key) if key else None,
+        "total": len(messages),
+        "unread_ids": [m.get("id") for m in messages if not m.get("read", False)],
+    }
+    try:
+        with open(UNREAD_FILE, "wb") as f:
+            f.write(json_dumps_pretty(summary))
+    except OSError:
+        pass
+    return summary
+
+
+def get_inbox_summary() -> dict:
+    """
+    Get {"total", "unread_ids"} for the inbox without parsing it if possible.
+
+    The summary file is written alongside the inbox and tagged with the
+    inbox's (mtime_ns, size); if the inbox was edited since (e.g. messages
+    marked read by hand) the summary is recomputed.
+    """
+    key = _file_key(INBOX_FILE)
+    if key is None:
+        return {"inbox_key": None, "total": 0, "unread_ids": []}
+
+    try:
+        with open(UNREAD_FILE, "rb") as f:
+            summary = json_loads(f.read())
+        if summary.get("inbox_key") == list(key):
+            return summary
+    except (OSError, ValueError):
+        pass
+
+    return _save_unread_summary(key, load_inbox())
 
 
 def add_message(user: str, channel: str, text: str, timestamp: str):
     """Add a new message to the inbox."""
+    with _inbox_lock:
+        message = _append_message(user, channel, text, timestamp)
+    log(f"New message from {user}: {text[:50]}...")
+
+    return message
+
+
+def _append_message(user: str, channel: str, text: str, timestamp: str) -> dict:
+    """Append a message to the inbox file and the known timestamps (caller holds _inbox_lock)."""
     inbox = load_inbox()
+    known_in_sync = _KNOWN_TS["key"] == _INBOX_CACHE["key"]
 
     message = {
         "id": len(inbox) + 1,
@@ -93,7 +234,11 @@ def add_message(user: str, channel: str, text: str, timestamp: str):
 
     inbox.append(message)
     save_inbox(inbox)
-    log(f"New message from {user}: {text[:50]}...")
+
+    if known_in_sync:
+        if timestamp:
+            _KNOWN_TS["data"].add(timestamp)
+        _KNOWN_TS["key"] = _INBOX_CACHE["key"]
 
     return message
 
@@ -118,6 +263,142 @@ def clear_inbox():
     log("Inbox cleared")
 
 
+def _cached_name(cache: dict, key: str):
+    """Return a cached name if it hasn't expired, else None."""
+    entry = cache.get(key)
+    if entry and entry[1] > time.time():
+        return entry[0]
+    return None
+
+
+def _load_user_cache():
+    """Seed _USER_CACHE from the cache file on first use, dropping expired entries."""
+    with _user_cache_lock:
+        if _user_cache_state["loaded"]:
+            return
+        _user_cache_state["loaded"] = True
+        _read_user_cache_file()
+    atexit.register(save_user_cache, force=True)
+
+
+def _read_user_cache_file():
+    """Load unexpired entries from USER_CACHE_FILE into _USER_CACHE."""
+    global _user_directory_loaded_at
+
+    try:
+        with open(USER_CACHE_FILE, "rb") as f:
+            data = json_loads(f.read())
+    except (OSError, ValueError):
+        return
+
+    now = time.time()
+    for user_id, entry in data.get("users", {}).items():
+        if entry["expires_at"] > now:
+            _USER_CACHE[user_id] = (entry["name"], entry["expires_at"])
+    _user_directory_loaded_at = data.get("directory_loaded_at", 0.0)
+
+
+def save_user_cache(force: bool = False):
+    """Write unsaved user cache entries to disk (throttled unless force is set)."""
+    with _user_cache_lock:
+        if not _user_cache_state["dirty"]:
+            return
+        now = time.time()
+        if not force and now - _user_cache_state["saved_at"] < USER_CACHE_SAVE_INTERVAL:
+            return
+
+        data = {
+            "directory_loaded_at": _user_directory_loaded_at,
+            "users": {
+                user_id: {"name": name, "expires_at": expires_at}
+                for user_id, (name, expires_at) in list(_USER_CACHE.items())
+                if expires_at > now
+            },
+        }
+        try:
+            tmp_path = USER_CACHE_FILE.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(json_dumps_pretty(data))
+            os.replace(tmp_path, USER_CACHE_FILE)
+        except OSError as e:
+            log(f"[WARN] Failed to save user cache: {e}")
+            return
+
+        _user_cache_state["dirty"] = False
+        _user_cache_state["saved_at"] = now
+
+
+def resolve_user(client, user_id: str) -> str:
+    """Get a user's display name, falling back to the user ID if the lookup fails."""
+    _load_user_cache()
+    name = _cached_name(_USER_CACHE, user_id)
+    if name:
+        return name
+
+    try:
+        user = client.users_info(user=user_id)["user"]
+    except Exception:
+        return user_id  # Not cached, so a transient failure is retried next time
+
+    name = user.get("real_name") or user.get("name") or user_id
+    _USER_CACHE[user_id] = (name, time.time() + USER_CACHE_TTL)
+    _user_cache_state["dirty"] = True
+    save_user_cache()
+    return name
+
+
+def preload_user_directory(client):
+    """
+    Fill the user name cache from users.list.
+
+    One paginated walk of the workspace directory replaces a users.info call
+    per unknown sender. Skipped while the last load is still fresh; users the
+    directory doesn't cover (e.g. from shared channels) are still looked up
+    individually by resolve_user.
+    """
+    global _user_directory_loaded_at
+
+    _load_user_cache()
+    now = time.time()
+    if now - _user_directory_loaded_at < USER_CACHE_TTL:
+        return
+
+    expires_at = now + USER_CACHE_TTL
+    cursor = None
+    try:
+        while True:
+            result = client.users_list(limit=USER_DIRECTORY_PAGE_SIZE, cursor=cursor)
+            for user in result.get("members", []):
+                name = user.get("real_name") or user.get("name")
+                if name:
+                    _USER_CACHE[user["id"]] = (name, expires_at)
+            cursor = result.get("response_metadata", {}).get("next_cursor")
+            if not cursor:
+                break
+    except Exception as e:
+        log(f"[WARN] Failed to load user directory: {e}")
+        return
+
+    _user_directory_loaded_at = now
+    _user_cache_state["dirty"] = True
+    save_user_cache(force=True)
+
+
+def resolve_channel_name(client, channel_id: str) -> str:
+    """Get a channel's name, falling back to the channel ID if the lookup fails."""
+    name = _cached_name(_CHANNEL_CACHE, channel_id)
+    if name:
+        return name
+
+    try:
+        name = client.conversations_info(channel=channel_id)["channel"]["name"]
+    except Exception:
+        return channel_id
+
+    _CHANNEL_CACHE[channel_id] = (name, time.time() + CHANNEL_CACHE_TTL)
+    return name
+
+
 def get_last_sync_ts() -> str:
     """Get the timestamp of last sync, or None if never synced."""
     if LAST_SYNC_FILE.exists():
@@ -134,9 +415,34 @@ def set_last_sync_ts(ts: str):
 
 
 def get_known_timestamps() -> set:
-    """Get set of all message timestamps we already have."""
-    inbox = load_inbox()
-    return {msg.get("timestamp") for msg in inbox if msg.get("timestamp")}
+    """
+    Get set of all message timestamps we already have.
+
+    The set is shared and kept current by add_message; it is only rebuilt
+    when the inbox file was changed by something else.
+    """
+    with _inbox_lock:
+        inbox = load_inbox()
+        if _KNOWN_TS["key"] is None or _KNOWN_TS["key"] != _INBOX_CACHE["key"]:
+            _KNOWN_TS["data"] = {msg.get("timestamp") for msg in inbox if msg.get("timestamp")}
+            _KNOWN_TS["key"] = _INBOX_CACHE["key"]
+        return _KNOWN_TS["data"]
+
+
+def iter_history(client, channel_id: str, limit: int):
+    """
+    Yield pages of channel history, newest first, following Slack's cursor.
+
+    Stops when there are no more pages; callers break out once they have
+    gone back far enough.
+    """
+    cursor = None
+    while True:
+        result = client.conversations_history(channel=channel_id, limit=limit, cursor=cursor)
+        yield result.get("messages", [])
+        cursor = result.get("response_metadata", {}).get("next_cursor")
+        if not cursor:
+            return
 
 
 def sync_history(channel_id: str = None, limit: int = 50) -> int:
@@ -144,6 +450,10 @@ def sync_history(channel_id: str = None, limit: int = 50) -> int:
     Fetch recent channel history and add any missed messages.
     Also fetches thread replies for messages with replies.
 
+    Pages further back (up to SYNC_MAX_PAGES pages of `limit` messages) until
+    reaching a message already in the inbox, so a long outage doesn't drop
+    messages. An empty inbox only gets the most recent page.
+
     Returns the number of new messages added.
     """
     from slack_sdk import WebClient
@@ -156,6 +466,7 @@ def sync_history(channel_id: str = None, limit: int = 50) -> int:
         return 0
 
     client = WebClient(token=bot_token)
+    preload_user_directory(client)
     known_ts = get_known_timestamps()
     new_count = 0
 
@@ -177,11 +488,7 @@ def sync_history(channel_id: str = None, limit: int = 50) -> int:
         text = msg.get("text", "")
 
         # Get user display name (use user_id if lookup fails)
-        try:
-            user_info = client.users_info(user=user_id)
-            user_name = user_info["user"].get("real_name") or user_info["user"].get("name") or user_id
-        except Exception:
-            user_name = user_id
+        user_name = resolve_user(client, user_id)
 
         # Add to inbox
         add_message(
@@ -194,35 +501,50 @@ def sync_history(channel_id: str = None, limit: int = 50) -> int:
         new_count += 1
 
     try:
-        # Fetch recent messages
+        # Fetch recent messages, paging back until we overlap the inbox
         log(f"Syncing history from channel {channel_id}...")
-        result = client.conversations_history(channel=channel_id, limit=limit)
+        messages = []
+        for page_num, page in enumerate(iter_history(client, channel_id, limit), 1):
+            messages.extend(page)
+            if not known_ts or page_num >= SYNC_MAX_PAGES:
+                break
+            if any(msg.get("ts") in known_ts for msg in page):
+                break
 
-        messages = result.get("messages", [])
         log(f"Fetched {len(messages)} messages from channel")
 
-        # Process messages (oldest first)
+        # Fetch all thread replies up front, concurrently; each thread is an
+        # independent round-trip
+        def fetch_replies(thread_ts):
+            try:
+                replies_result = client.conversations_replies(
+                    channel=channel_id,
+                    ts=thread_ts,
+                    limit=100
+                )
+                # Skip first message (it's the parent)
+                return replies_result.get("messages", [])[1:]
+            except Exception as e:
+                log(f"[WARN] Failed to fetch thread replies for {thread_ts}: {e}")
+                return []
+
+        thread_ts_list = [msg.get("ts", "") for msg in messages if msg.get("reply_count", 0) > 0]
+        with ThreadPoolExecutor(max_workers=SYNC_WORKERS) as pool:
+            replies_by_ts = dict(zip(thread_ts_list, pool.map(fetch_replies, thread_ts_list)))
+
+            # Resolve senders the directory didn't cover in parallel too, so
+            # the in-order pass below only hits the cache
+            candidates = messages + [r for replies in replies_by_ts.values() for r in replies]
+            user_ids = {msg["user"] for msg in candidates
+                        if msg.get("user") and not msg.get("bot_id")
+                        and msg.get("ts", "") not in known_ts}
+            list(pool.map(lambda uid: resolve_user(client, uid), user_ids))
+
+        # Process messages (oldest first), each followed by its thread replies
         for msg in reversed(messages):
-            # Process the main message
             process_message(msg)
-
-            # Check if this message has thread replies
-            reply_count = msg.get("reply_count", 0)
-            if reply_count > 0:
-                thread_ts = msg.get("ts", "")
-                try:
-                    # Fetch thread replies
-                    replies_result = client.conversations_replies(
-                        channel=channel_id,
-                        ts=thread_ts,
-                        limit=100
-                    )
-                    replies = replies_result.get("messages", [])
-                    # Skip first message (it's the parent), process replies
-                    for reply in replies[1:]:
-                        process_message(reply, is_thread_reply=True)
-                except Exception as e:
-                    log(f"[WARN] Failed to fetch thread replies for {thread_ts}: {e}")
+            for reply in replies_by_ts.get(msg.get("ts", ""), []):
+                process_message(reply, is_thread_reply=True)
 
         # Update last sync timestamp
         if messages:
@@ -240,17 +562,18 @@ def sync_history(channel_id: str = None, limit: int = 50) -> int:
 
 def check_inbox():
     """Display inbox status."""
-    inbox = load_inbox()
-    unread = get_unread_messages()
+    summary = get_inbox_summary()
 
     print(f"\n{'='*60}")
     print("SLACK INBOX STATUS")
     print(f"{'='*60}")
-    print(f"Total messages: {len(inbox)}")
-    print(f"Unread messages: {len(unread)}")
+    print(f"Total messages: {summary['total']}")
+    print(f"Unread messages: {len(summary['unread_ids'])}")
     print(f"{'='*60}\n")
 
-    if unread:
+    # Only parse the full inbox when there are message bodies to show
+    if summary["unread_ids"]:
+        unread = get_unread_messages()
         print("UNREAD MESSAGES:\n")
         for msg in unread:
             print(f"  [{msg['id']}] From: {msg['user']}")
@@ -262,7 +585,7 @@ def check_inbox():
         print("No unread messages.\n")
 
 
-def poll_for_messages(interval: int = 10, channel_id: str = None):
+def poll_for_messages(interval: int = 10, channel_id: str = None, react: bool = True):
     """
     Poll Slack for new messages at regular intervals.
 
@@ -272,8 +595,8 @@ def poll_for_messages(interval: int = 10, channel_id: str = None):
     Args:
         interval: Seconds between polls (default: 10)
         channel_id: Channel to monitor (default: from env or C0A8LB49E1M)
+        react: Add an :eyes: reaction to newly received messages
     """
-    import time
     from slack_sdk import WebClient
 
     channel_id = channel_id or DEFAULT_CHANNEL_ID
@@ -297,8 +620,20 @@ def poll_for_messages(interval: int = 10, channel_id: str = None):
     # Track the latest timestamp we've seen
     last_ts = get_last_sync_ts() or "0"
 
+    # Never let a slow poll cycle push live messages past the reaction cutoff
+    reaction_max_age = max(REACTION_MAX_AGE, 2 * interval)
+
+    # Consecutive polls that returned nothing; doubles the wait each time
+    idle_streak = 0
+    max_interval = max(interval, POLL_MAX_IDLE_INTERVAL)
+
+    # slack_bot.py stops us with SIGTERM; wake the wait below and exit cleanly
+    # (so atexit handlers run) instead of dying mid-sleep
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+
     try:
-        while True:
+        while not stop.is_set():
             try:
                 # Fetch recent messages since last check
                 result = client.conversations_history(
@@ -309,6 +644,7 @@ def poll_for_messages(interval: int = 10, channel_id: str = None):
 
                 messages = result.get("messages", [])
                 new_count = 0
+                idle_streak = 0 if messages else idle_streak + 1
 
                 # Process messages (oldest first)
                 for msg in reversed(messages):
@@ -335,15 +671,18 @@ def poll_for_messages(interval: int = 10, channel_id: str = None):
                     known_ts.add(ts)
                     new_count += 1
 
-                    # Add reaction to acknowledge
-                    try:
-                        client.reactions_add(channel=channel_id, timestamp=ts, name="eyes")
-                    except Exception:
-                        pass  # May fail if already reacted
+                    # Add reaction to acknowledge (recent messages only)
+                    if react and time.time() - float(ts or 0) < reaction_max_age:
+                        try:
+                            client.reactions_add(channel=channel_id, timestamp=ts, name="eyes")
+                        except Exception:
+                            pass  # May fail if already reacted
 
                 # Update last timestamp
                 if messages:
-                    latest_ts = max(msg.get("ts", "0") for msg in messages)
+                    # conversations.history returns newest first, so the
+                    # first message has the latest timestamp
+                    latest_ts = messages[0].get("ts", "0")
                     if latest_ts > last_ts:
                         last_ts = latest_ts
                         set_last_sync_ts(last_ts)
@@ -361,16 +700,21 @@ def poll_for_messages(interval: int = 10, channel_id: str = None):
             except Exception as e:
                 log(f"[ERROR] Poll failed: {e}")
 
-            # Wait for next poll
-            time.sleep(interval)
+            # Wait for next poll, longer while the channel stays quiet
+            stop.wait(min(interval * 2 ** min(idle_streak, 16), max_interval))
+
+        log("Poll mode stopped.")
+        return 0
 
     except KeyboardInterrupt:
         log("\nPoll mode stopped by user.")
         return 0
 
 
-def create_app() -> App:
+def create_app():
     """Create and configure the Slack Bolt app."""
+    from slack_bolt import App
+
     bot_token = os.getenv("SLACK_BOT_TOKEN")
 
     if not bot_token:
@@ -393,18 +737,10 @@ def create_app() -> App:
         ts = event.get("ts", "")
 
         # Get user info for display name
-        try:
-            user_info = client.users_info(user=user_id)
-            user_name = user_info["user"]["real_name"] or user_info["user"]["name"]
-        except Exception:
-            user_name = user_id
+        user_name = resolve_user(client, user_id)
 
         # Get channel info
-        try:
-            channel_info = client.conversations_info(channel=channel_id)
-            channel_name = channel_info["channel"]["name"]
-        except Exception:
-            channel_name = channel_id
+        channel_name = resolve_channel_name(client, channel_id)
 
         # Save the message
         add_message(
@@ -430,18 +766,10 @@ def create_app() -> App:
         ts = event.get("ts", "")
 
         # Get user info
-        try:
-            user_info = client.users_info(user=user_id)
-            user_name = user_info["user"]["real_name"] or user_info["user"]["name"]
-        except Exception:
-            user_name = user_id
+        user_name = resolve_user(client, user_id)
 
         # Get channel info
-        try:
-            channel_info = client.conversations_info(channel=channel_id)
-            channel_name = channel_info["channel"]["name"]
-        except Exception:
-            channel_name = channel_id
+        channel_name = resolve_channel_name(client, channel_id)
 
         # Save the message
         add_message(
@@ -507,6 +835,11 @@ def main():
         default=10,
         help="Polling interval in seconds (default: 10)"
     )
+    parser.add_argument(
+        "--no-react",
+        action="store_true",
+        help="Don't add an :eyes: reaction to messages picked up in poll mode"
+    )
 
     args = parser.parse_args()
 
@@ -533,7 +866,7 @@ def main():
 
     # Poll mode - simpler, only needs bot token
     if args.poll:
-        return poll_for_messages(interval=args.interval)
+        return poll_for_messages(interval=args.interval, react=not args.no_react)
 
     # Socket Mode - needs both tokens
     app_token = os.getenv("SLACK_APP_TOKEN")
@@ -566,6 +899,8 @@ def main():
     log(f"Inbox file: {INBOX_FILE}")
     log("Listening for messages. Press Ctrl+C to stop.")
 
+    from slack_bolt.adapter.socket_mode import SocketModeHandler
+
     try:
         handler = SocketModeHandler(app, app_token)
         handler.start()
@@ -9,6 +9,7 @@ Usage:
     python helpers/slack_notify.py "Your message here"
     python helpers/slack_notify.py --channel general "Message to #general"
     python helpers/slack_notify.py --urgent "Critical issue!"
+    some_command | python helpers/slack_notify.py --batch
 
 Arguments:
     message         The message to send
@@ -16,6 +17,7 @@ Arguments:
     --urgent        Add urgent emoji prefix
     --code          Format message as code block
     --title         Add a bold title above the message
+    --batch         Send each stdin line as a message, combined into few posts
 
 Examples:
     python helpers/slack_notify.py "Build completed successfully"
@@ -27,17 +29,53 @@ Environment:
 """
 
 import argparse
+import atexit
 import sys
 import os
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 
-# Load environment variables from project root
-from dotenv import load_dotenv
+# Environment variables are loaded from the project root .env, and slack_sdk
+# imported, only when a message is actually sent (not for --help or usage errors)
 env_path = Path(__file__).parent.parent / '.env'
-load_dotenv(env_path)
 
-from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
+# Rate-limited (429, honouring Retry-After) and 5xx responses are retried this
+# many times before the error reaches the caller
+MAX_RETRIES = 3
+
+# Queued messages are combined into posts of at most this many characters
+# (Slack recommends keeping message text under 4,000)
+BATCH_MAX_CHARS = 3900
+
+
+@lru_cache(maxsize=1)
+def _load_env():
+    """Load .env once per process, skipping it if the token is already exported."""
+    if not os.getenv("SLACK_BOT_TOKEN"):
+        from dotenv import load_dotenv
+        load_dotenv(env_path, override=False)
+
+
+@lru_cache(maxsize=1)
+def _get_client():
+    """Create the Slack client once and reuse it for every call in this process."""
+    from slack_sdk import WebClient
+    from slack_sdk.http_retry.builtin_handlers import (
+        RateLimitErrorRetryHandler,
+        ServerErrorRetryHandler,
+    )
+
+    _load_env()
+    token = os.getenv("SLACK_BOT_TOKEN")
+    if not token:
+        raise ValueError("SLACK_BOT_TOKEN not found in environment. Check .env file.")
+
+    client = WebClient(token=token)
+    # Ride out bursts instead of losing the message to a single 429 or 5xx
+    client.retry_handlers.append(RateLimitErrorRetryHandler(max_retry_count=MAX_RETRIES))
+    client.retry_handlers.append(ServerErrorRetryHandler(max_retry_count=MAX_RETRIES))
+    return client
 
 
 def add_reaction(channel: str, timestamp: str, emoji: str = "white_check_mark") -> dict:
@@ -52,11 +90,7 @@ def add_reaction(channel: str, timestamp: str, emoji: str = "white_check_mark")
     Returns:
         Slack API response dict
     """
-    token = os.getenv("SLACK_BOT_TOKEN")
-    if not token:
-        raise ValueError("SLACK_BOT_TOKEN not found in environment. Check .env file.")
-
-    client = WebClient(token=token)
+    client = _get_client()
 
     response = client.reactions_add(
         channel=channel,
@@ -91,13 +125,21 @@ def send_slack_message(
         SlackApiError: If message fails to send
         ValueError: If token not configured
     """
-    token = os.getenv("SLACK_BOT_TOKEN")
-    if not token:
-        raise ValueError("SLACK_BOT_TOKEN not found in environment. Check .env file.")
+    client = _get_client()
+
+    # Send message
+    response = client.chat_postMessage(
+        channel=f"#{channel}",
+        text=format_message(message, urgent, code_block, title),
+        mrkdwn=True
+    )
+
+    return response
 
-    client = WebClient(token=token)
 
-    # Build message
+def format_message(message: str, urgent: bool = False, code_block: bool = False,
+                   title: str = None) -> str:
+    """Build the Slack text for a message with the optional urgent/title/code formatting."""
     text_parts = []
 
     if urgent:
@@ -111,16 +153,74 @@ def send_slack_message(
     else:
         text_parts.append(message)
 
-    full_message = "\n".join(text_parts)
+    return "\n".join(text_parts)
 
-    # Send message
-    response = client.chat_postMessage(
-        channel=f"#{channel}",
-        text=full_message,
-        mrkdwn=True
-    )
 
-    return response
+class SlackQueue:
+    """
+    Collects messages and posts them to each channel in as few requests as possible.
+
+    Consecutive messages for a channel are joined with newlines into posts of
+    up to BATCH_MAX_CHARS, so a burst of notifications costs one
+    chat.postMessage per post instead of one per message and stays under
+    Slack's per-channel rate limit. The urgent/title/code formatting is
+    applied once to each post, not to every queued message.
+    """
+
+    def __init__(self, max_chars: int = BATCH_MAX_CHARS, flush_on_exit: bool = True,
+                 urgent: bool = False, code_block: bool = False, title: str = None):
+        self.max_chars = max_chars
+        self.urgent = urgent
+        self.code_block = code_block
+        self.title = title
+        self.pending = {}  # channel -> deque of message texts
+        if flush_on_exit:
+            atexit.register(self._flush_at_exit)
+
+    def enqueue(self, channel: str, text: str):
+        """Queue a message for a channel (name without #)."""
+        self.pending.setdefault(channel, deque()).append(text)
+
+    def flush(self) -> list:
+        """
+        Post all queued messages.
+
+        Returns:
+            List of Slack API response dicts, one per post
+
+        Raises:
+            SlackApiError: If a post fails (messages not yet posted stay queued)
+        """
+        responses = []
+        # Leave room for the formatting added around each post
+        max_chars = self.max_chars - len(format_message("", self.urgent, self.code_block, self.title))
+        for channel, queue in self.pending.items():
+            while queue:
+                # Always take at least one message, even if it alone is too long
+                parts = [queue.popleft()]
+                size = len(parts[0])
+                while queue and size + 1 + len(queue[0]) <= max_chars:
+                    size += 1 + len(queue[0])
+                    parts.append(queue.popleft())
+
+                try:
+                    responses.append(_get_client().chat_postMessage(
+                        channel=f"#{channel}",
+                        text=format_message("\n".join(parts), self.urgent, self.code_block, self.title),
+                        mrkdwn=True
+                    ))
+                except Exception:
+                    queue.extendleft(reversed(parts))
+                    raise
+        return responses
+
+    def _flush_at_exit(self):
+        """Flush from atexit, reporting failures instead of raising during shutdown."""
+        try:
+            self.flush()
+        except Exception as e:
+            unsent = sum(len(queue) for queue in self.pending.values())
+            print(f"[ERROR] Could not send {unsent} queued Slack message(s): {e}", file=sys.stderr)
 
 
 def main():
@@ -158,6 +258,11 @@ def main():
         action="store_true",
         help="Send a test message"
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Read messages from stdin, one per line, and send them in as few posts as possible"
+    )
     parser.add_argument(
         "--react",
         action="store_true",
@@ -175,6 +280,8 @@ def main():
 
     args = parser.parse_args()
 
+    from slack_sdk.errors import SlackApiError
+
     # Handle reaction mode
     if args.react:
         if not args.timestamp:
@@ -207,10 +314,21 @@ def main():
         args.message = "Test message from Claude Code. Slack integration is working!"
         args.title = "Connection Test"
 
-    if not args.message:
+    if not args.message and not args.batch:
         parser.error("Message required (or use --test)")
 
     try:
+        if args.batch:
+            messages = [args.message] if args.message else []
+            messages += [line.rstrip("\n") for line in sys.stdin if line.strip()]
+            queue = SlackQueue(flush_on_exit=False, urgent=args.urgent, code_block=args.code,
+                               title=args.title)
+            for message in messages:
+                queue.enqueue(args.channel, message)
+            responses = queue.flush()
+            print(f"[OK] {len(messages)} message(s) sent to #{args.channel} in {len(responses)} post(s)")
+            return 0
+
         response = send_slack_message(
             message=args.message,
             channel=args.channel,
@@ -19,12 +19,18 @@ Models (accuracy vs speed tradeoff):
     turbo   - Fast + accurate, recommended if you have GPU
 
 First run will download the model (~74MB for tiny, ~1.5GB for medium).
+
+Uses faster-whisper (CTranslate2, int8) when installed - several times faster
+on CPU - and falls back to openai-whisper otherwise:
+    pip install faster-whisper
 """
 
 import argparse
 import sys
 import tempfile
 import os
+import wave
+from functools import lru_cache
 from pathlib import Path
 
 def list_audio_devices():
@@ -42,7 +48,6 @@ def list_audio_devices():
 def record_audio(duration: float, device: int = None) -> str:
     """Record audio from microphone and save to temp file."""
     import sounddevice as sd
-    from scipy.io import wavfile
 
     sample_rate = 16000  # Whisper expects 16kHz
 
@@ -64,21 +69,46 @@ def record_audio(duration: float, device: int = None) -> str:
 
     print("Recording complete.")
 
-    # Save to temp file
-    temp_file = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
-    wavfile.write(temp_file.name, sample_rate, audio)
+    # Save to temp file as 16-bit mono PCM
+    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
+        with wave.open(temp_file, 'wb') as w:
+            w.setnchannels(1)
+            w.setsampwidth(2)
+            w.setframerate(sample_rate)
+            w.writeframes(audio.tobytes())
 
     return temp_file.name
 
+@lru_cache(maxsize=2)
+def _load_model(model_name: str):
+    """
+    Load a Whisper model once per process; later calls reuse it.
+
+    Returns:
+        (backend, model) where backend is "faster-whisper" or "whisper"
+    """
+    try:
+        from faster_whisper import WhisperModel
+    except ImportError:
+        import whisper
+
+        print(f"Loading Whisper model '{model_name}'...")
+        return "whisper", whisper.load_model(model_name)
+
+    print(f"Loading Whisper model '{model_name}' (faster-whisper)...")
+    return "faster-whisper", WhisperModel(model_name, device="auto", compute_type="int8")
+
 def transcribe(audio_path: str, model_name: str = "base") -> str:
     """Transcribe audio file using Whisper."""
-    import whisper
-
-    print(f"Loading Whisper model '{model_name}'...")
-    model = whisper.load_model(model_name)
+    backend, model = _load_model(model_name)
 
     print("Transcribing...")
-    result = model.transcribe(audio_path)
+    if backend == "faster-whisper":
+        segments, _ = model.transcribe(audio_path)
+        return " ".join(segment.text.strip() for segment in segments).strip()
+
+    # FP16 only helps on GPU; on CPU whisper would warn and fall back to FP32
+    result = model.transcribe(audio_path, fp16=model.device.type == "cuda")
 
     return result["text"].strip()
 
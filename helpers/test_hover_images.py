@@ -2,7 +2,29 @@
 """Test that hover card images change between markers."""
 
 import sys
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+
+# Resolves once the hover card is shown with an image other than the previous one
+HOVER_IMAGE_CHANGED_JS = """prev => {
+    const card = document.querySelector('#wiki-hover-card');
+    const img = document.querySelector('#wiki-hover-image');
+    return !!(card && card.getClientRects().length && img && img.src && img.src !== prev);
+}"""
+
+# Current hover image src if the card is shown, else null (no waiting)
+VISIBLE_HOVER_SRC_JS = """() => {
+    const card = document.querySelector('#wiki-hover-card');
+    const img = document.querySelector('#wiki-hover-image');
+    return card && card.getClientRects().length && img && img.src ? img.src : null;
+}"""
+
+def wait_for_src_change(page, prev_src, timeout=500):
+    """Wait until the hover card shows a new image; returns False on timeout."""
+    try:
+        page.wait_for_function(HOVER_IMAGE_CHANGED_JS, arg=prev_src, timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
 
 def test_hover_images(url="http://localhost:5000"):
     with sync_playwright() as p:
@@ -21,8 +43,11 @@ def test_hover_images(url="http://localhost:5000"):
         page.wait_for_selector(".plotly", timeout=15000)
         print("Chart loaded")
 
-        # Wait a bit for markers to render
-        page.wait_for_timeout(2000)
+        # Wait for markers to render
+        try:
+            page.wait_for_selector("g.scatter path", state="attached", timeout=2000)
+        except PlaywrightTimeoutError:
+            pass
 
         # Find marker elements (triangles on the chart)
         # The markers are SVG paths in Plotly
@@ -33,6 +58,7 @@ def test_hover_images(url="http://localhost:5000"):
         hover_image = page.locator("#wiki-hover-image")
 
         image_srcs = []
+        prev_src = None
 
         # Try to hover over several markers and capture image sources
         # We'll hover over points in the chart area
@@ -50,15 +76,15 @@ def test_hover_images(url="http://localhost:5000"):
             for i, (x, y) in enumerate(test_positions):
                 print(f"Hovering at position {i+1}: ({x:.0f}, {y:.0f})")
                 page.mouse.move(x, y)
-                page.wait_for_timeout(500)
 
-                # Check if hover card is visible
-                card = page.locator("#wiki-hover-card")
-                if card.is_visible():
+                # Returns as soon as the card shows a new image. On timeout the
+                # card is either hidden or still shows the previous image; read
+                # its state once (no further wait) so repeats are still counted
+                if wait_for_src_change(page, prev_src) or page.evaluate(VISIBLE_HOVER_SRC_JS):
                     src = hover_image.get_attribute("src")
-                    if src:
-                        image_srcs.append(src[:50])  # Just first 50 chars
-                        print(f"  Got image src: {src[:50]}...")
+                    prev_src = hover_image.evaluate("img => img.src")
+                    image_srcs.append(src[:50])  # Just first 50 chars
+                    print(f"  Got image src: {src[:50]}...")
                 else:
                     print("  Hover card not visible")
 
@@ -3,20 +3,48 @@
 
 import sys
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+
+NUM_REQUESTS = 5
+CHUNK_SIZE = 64 * 1024
+
+def fetch_hash(session, url):
+    """Fetch url and hash the body as it streams in; returns (status, bytes, hash)."""
+    with session.get(url, stream=True, timeout=30) as resp:
+        if resp.status_code != 200:
+            return resp.status_code, 0, None
+        h = hashlib.blake2b(digest_size=6)
+        n = 0
+        for chunk in resp.iter_content(CHUNK_SIZE):
+            h.update(chunk)
+            n += len(chunk)
+    return resp.status_code, n, h.hexdigest()
 
 def test_image_api(url="http://localhost:5000"):
     print(f"Testing image API at {url}/api/images/cat")
 
+    # One keep-alive session, requests issued concurrently
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=NUM_REQUESTS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    with session, ThreadPoolExecutor(max_workers=NUM_REQUESTS) as pool:
+        results = list(pool.map(
+            lambda _: fetch_hash(session, f"{url}/api/images/cat"),
+            range(NUM_REQUESTS)
+        ))
+
     hashes = []
-    for i in range(5):
-        resp = requests.get(f"{url}/api/images/cat", timeout=30)
-        if resp.status_code == 200:
-            h = hashlib.md5(resp.content, usedforsecurity=False).hexdigest()[:12]
+    for i, (status, n, h) in enumerate(results):
+        if status == 200:
             hashes.append(h)
-            print(f"  Request {i+1}: {len(resp.content)} bytes, hash: {h}")
+            print(f"  Request {i+1}: {n} bytes, hash: {h}")
         else:
-            print(f"  Request {i+1}: ERROR {resp.status_code}")
+            print(f"  Request {i+1}: ERROR {status}")
 
     unique = set(hashes)
     print(f"\nResults: {len(hashes)} requests, {len(unique)} unique images")
@@ -16,6 +16,7 @@ Commands:
     check       Verify an element exists and is visible
     smoke       Run basic smoke test (page loads, no JS errors)
     verify      Check multiple elements exist
+    persistent  Read commands from stdin, one per line, sharing one browser
 
 Examples:
     # Take screenshot of Stock Analyzer
@@ -26,16 +27,85 @@ Examples:
 
     # Verify multiple elements after a feature change
     python helpers/ui_test.py verify http://localhost:5000 -s "#show-bollinger,#stock-chart"
+
+    # Run several checks without relaunching the browser for each
+    printf 'check http://localhost:5000 -s "#search-btn"\nsmoke http://localhost:5000\n' \
+        | python helpers/ui_test.py persistent
 """
 
 import argparse
+import shlex
 import sys
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
 
+VIEWPORT = {"width": 1920, "height": 1080}
+
+# Polls all selectors inside the page until every one is visible or the timeout
+# passes, so verifying N elements is one round trip instead of N waits.
+# Visibility matches Playwright's: a non-empty box and not visibility:hidden.
+# Selectors querySelector can't parse (Playwright-only syntax) come back null.
+WAIT_FOR_ALL_VISIBLE_JS = """
+([selectors, timeout]) => new Promise(resolve => {
+    const start = Date.now();
+    const isVisible = sel => {
+        let el;
+        try {
+            el = document.querySelector(sel);
+        } catch (e) {
+            return null;
+        }
+        return !!el && el.getClientRects().length > 0
+            && getComputedStyle(el).visibility !== "hidden";
+    };
+    const tick = () => {
+        const found = selectors.map(isVisible);
+        if (found.every(f => f !== false) || Date.now() - start > timeout) {
+            resolve(found);
+        } else {
+            setTimeout(tick, 50);
+        }
+    };
+    tick();
+})
+"""
+
+
+@contextmanager
+def browser_session():
+    """Launch a headless browser that several commands can share."""
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        try:
+            yield browser
+        finally:
+            browser.close()
+
+
+@contextmanager
+def _page(browser=None):
+    """
+    Open a fresh page, on the given browser or on a browser launched just for it.
+
+    Each page gets its own context, so commands sharing a browser don't share
+    cookies, storage or event handlers.
+    """
+    if browser is None:
+        with browser_session() as own_browser, _page(own_browser) as page:
+            yield page
+        return
+
+    page = browser.new_page(viewport=VIEWPORT)
+    try:
+        yield page
+    finally:
+        page.context.close()
 
-def take_screenshot(url: str, output: str = None, full_page: bool = True, wait: int = 2000) -> str:
+
+def take_screenshot(url: str, output: str = None, full_page: bool = True, wait: int = 2000,
+                    browser=None) -> str:
     """
     Take a screenshot of a webpage.
 
@@ -44,6 +114,7 @@ def take_screenshot(url: str, output: str = None, full_page: bool = True, wait:
         output: Output file path (default: screenshot_YYYYMMDD_HHMMSS.png)
         full_page: Capture full scrollable page
         wait: Wait time in ms after page load
+        browser: Browser from browser_session to reuse (default: launch one)
 
     Returns:
         Path to saved screenshot
@@ -52,10 +123,7 @@ def take_screenshot(url: str, output: str = None, full_page: bool = True, wait:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output = f"screenshot_{timestamp}.png"
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={"width": 1920, "height": 1080})
-
+    with _page(browser) as page:
         print(f"Loading {url}...")
         page.goto(url, wait_until="networkidle")
         page.wait_for_timeout(wait)
@@ -63,13 +131,11 @@ def take_screenshot(url: str, output: str = None, full_page: bool = True, wait:
         print(f"Taking screenshot...")
         page.screenshot(path=output, full_page=full_page)
 
-        browser.close()
-
     print(f"Screenshot saved: {output}")
     return output
 
 
-def check_element(url: str, selector: str, timeout: int = 5000) -> bool:
+def check_element(url: str, selector: str, timeout: int = 5000, browser=None) -> bool:
     """
     Check if an element exists and is visible.
 
@@ -77,14 +143,12 @@ def check_element(url: str, selector: str, timeout: int = 5000) -> bool:
         url: Page URL
         selector: CSS selector for element
         timeout: Max wait time in ms
+        browser: Browser from browser_session to reuse (default: launch one)
 
     Returns:
         True if element found and visible
     """
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={"width": 1920, "height": 1080})
-
+    with _page(browser) as page:
         print(f"Loading {url}...")
         page.goto(url, wait_until="networkidle")
 
@@ -99,54 +163,51 @@ def check_element(url: str, selector: str, timeout: int = 5000) -> bool:
                 print(f"    Position: ({box['x']:.0f}, {box['y']:.0f})")
                 print(f"    Size: {box['width']:.0f}x{box['height']:.0f}")
                 print(f"    Text: {text}")
-                browser.close()
                 return True
         except PlaywrightTimeout:
             print(f"  NOT FOUND: {selector} (timeout after {timeout}ms)")
-            browser.close()
             return False
 
-        browser.close()
         return False
 
 
-def verify_elements(url: str, selectors: list, timeout: int = 5000) -> dict:
+def verify_elements(url: str, selectors: list, timeout: int = 5000, browser=None) -> dict:
     """
     Verify multiple elements exist on page.
 
     Args:
         url: Page URL
         selectors: List of CSS selectors
-        timeout: Max wait time per element in ms
+        timeout: Max wait time in ms (elements are waited for together)
+        browser: Browser from browser_session to reuse (default: launch one)
 
     Returns:
         Dict of selector -> found (bool)
     """
     results = {}
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={"width": 1920, "height": 1080})
-
+    with _page(browser) as page:
         print(f"Loading {url}...")
         page.goto(url, wait_until="networkidle")
 
-        for selector in selectors:
-            try:
-                element = page.wait_for_selector(selector, timeout=timeout, state="visible")
-                results[selector] = element is not None
-                status = "FOUND" if results[selector] else "NOT FOUND"
-                print(f"  [{status}] {selector}")
-            except PlaywrightTimeout:
-                results[selector] = False
-                print(f"  [NOT FOUND] {selector}")
+        # Wait for all CSS selectors at once rather than one timeout after another
+        found = page.evaluate(WAIT_FOR_ALL_VISIBLE_JS, [selectors, timeout])
 
-        browser.close()
+        for selector, visible in zip(selectors, found):
+            if visible is None:
+                # Not plain CSS (e.g. text= or xpath=); let Playwright resolve it
+                try:
+                    visible = page.wait_for_selector(selector, timeout=timeout, state="visible") is not None
+                except PlaywrightTimeout:
+                    visible = False
+            results[selector] = visible
+            status = "FOUND" if visible else "NOT FOUND"
+            print(f"  [{status}] {selector}")
 
     return results
 
 
-def smoke_test(url: str, timeout: int = 10000) -> dict:
+def smoke_test(url: str, timeout: int = 10000, browser=None) -> dict:
     """
     Run basic smoke test on a page.
 
@@ -158,6 +219,7 @@ def smoke_test(url: str, timeout: int = 10000) -> dict:
     Args:
         url: Page URL
         timeout: Max wait time in ms
+        browser: Browser from browser_session to reuse (default: launch one)
 
     Returns:
         Dict with test results
@@ -170,10 +232,7 @@ def smoke_test(url: str, timeout: int = 10000) -> dict:
         "status": "FAIL"
     }
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page(viewport={"width": 1920, "height": 1080})
-
+    with _page(browser) as page:
         # Capture console errors
         js_errors = []
         page.on("console", lambda msg: js_errors.append(msg.text) if msg.type == "error" else None)
@@ -209,12 +268,11 @@ def smoke_test(url: str, timeout: int = 10000) -> dict:
             print(f"Error during smoke test: {e}")
             results["error"] = str(e)
 
-        browser.close()
-
     return results
 
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (also used for each line in persistent mode)."""
     parser = argparse.ArgumentParser(
         description="UI Testing Helper using Playwright",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -240,25 +298,28 @@ def main():
     verify_parser = subparsers.add_parser("verify", help="Verify multiple elements")
     verify_parser.add_argument("url", help="Page URL")
     verify_parser.add_argument("--selectors", "-s", required=True, help="Comma-separated CSS selectors")
-    verify_parser.add_argument("--timeout", "-t", type=int, default=5000, help="Timeout per element in ms")
+    verify_parser.add_argument("--timeout", "-t", type=int, default=5000, help="Timeout in ms")
 
     # Smoke test command
     smoke_parser = subparsers.add_parser("smoke", help="Run smoke test")
     smoke_parser.add_argument("url", help="Page URL")
     smoke_parser.add_argument("--timeout", "-t", type=int, default=10000, help="Timeout in ms")
 
-    args = parser.parse_args()
+    # Persistent mode
+    subparsers.add_parser("persistent", help="Run commands from stdin with one shared browser")
+
+    return parser
 
-    if not args.command:
-        parser.print_help()
-        return 1
 
+def run_command(args, browser=None) -> int:
+    """Run one parsed command, returning its exit code."""
     if args.command == "screenshot":
         take_screenshot(
             url=args.url,
             output=args.output,
             full_page=not args.no_full_page,
-            wait=args.wait
+            wait=args.wait,
+            browser=browser
         )
         return 0
 
@@ -266,7 +327,8 @@ def main():
         found = check_element(
             url=args.url,
             selector=args.selector,
-            timeout=args.timeout
+            timeout=args.timeout,
+            browser=browser
         )
         return 0 if found else 1
 
@@ -275,18 +337,73 @@ def main():
         results = verify_elements(
             url=args.url,
             selectors=selectors,
-            timeout=args.timeout
+            timeout=args.timeout,
+            browser=browser
         )
         all_found = all(results.values())
         print(f"\nResult: {'ALL FOUND' if all_found else 'SOME MISSING'}")
         return 0 if all_found else 1
 
     elif args.command == "smoke":
-        results = smoke_test(url=args.url, timeout=args.timeout)
+        results = smoke_test(url=args.url, timeout=args.timeout, browser=browser)
         return 0 if results["status"] == "PASS" else 1
 
     return 0
 
 
+def run_persistent(parser: argparse.ArgumentParser) -> int:
+    """
+    Read commands from stdin (same syntax as the command line, one per line)
+    and run them all on one browser, skipping the launch cost per command.
+
+    Returns 0 if every command succeeded, 1 otherwise.
+    """
+    failures = 0
+    with browser_session() as browser:
+        for line in sys.stdin:
+            try:
+                argv = shlex.split(line)
+                if not argv or argv[0].startswith("#"):
+                    continue
+                args = parser.parse_args(argv)
+            except ValueError as e:
+                print(f"Could not parse command: {e}")
+                failures += 1
+                continue
+            except SystemExit:
+                failures += 1  # argparse already printed the error
+                continue
+            if args.command in (None, "persistent"):
+                print(f"Unsupported command: {line.strip()}")
+                failures += 1
+                continue
+
+            # One failing command shouldn't take the shared browser down with it
+            try:
+                exit_code = run_command(args, browser=browser)
+            except Exception as e:
+                print(f"Error: {e}")
+                exit_code = 1
+            print(f"[exit {exit_code}] {line.strip()}", flush=True)
+            if exit_code:
+                failures += 1
+
+    return 0 if failures == 0 else 1
+
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        return 1
+
+    if args.command == "persistent":
+        return run_persistent(parser)
+
+    return run_command(args)
+
+
 if __name__ == "__main__":
     sys.exit(main())